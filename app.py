@@ -1,11 +1,27 @@
 """
 Divestment SOW Auditor v2.0 - STREAMLIT WEB VERSION (100% FIXED)
+NOW WITH REAL AUDIT PIPELINE - Parallel DeepSeek calls via ThreadPoolExecutor
 """
 
 import streamlit as st
+import functools
+import hashlib
+import io
 import os
+import pickle
+import queue
+import tempfile
+import threading
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from datetime import date, timedelta
-import time
+
+from config import Config
+
+# Branchless icon lookups for pillar display (dict.get beats if/elif chains)
+_STATUS_ICON = {"Met": "✅", "Partial": "⚠️"}
+_RISK_ICON = {"Critical": "🔴", "High": "🟠", "Medium": "🟡", "Low": "🟢"}
 
 # Page config
 st.set_page_config(
@@ -19,112 +35,568 @@ st.title("🛡️ Divestment SOW Auditor v2.0")
 st.markdown("**Senior IT Contracts Expert • Fixed-Cost Compliance • Timeline Validation • DeepSeek AI**")
 st.markdown("---")
 
+@st.cache_resource
+def init_app():
+    """
+    One-time startup work - directory creation and config validation run
+    once per server process instead of on every script rerun.
+    """
+    Config.create_directories()
+    return Config.validate_config()
+
+
 # Sidebar
 st.sidebar.header("⚙️ Status")
-deepseek_key = os.getenv("DEEPSEEK_API_KEY")
-if deepseek_key:
+config_valid, config_messages = init_app()
+if Config.DEEPSEEK_API_KEY:
     st.sidebar.success("✅ DeepSeek AI Connected")
 else:
     st.sidebar.error("❌ DEEPSEEK_API_KEY missing in secrets!")
     st.stop()
+for message in config_messages:
+    if message.startswith("⚠️"):
+        st.sidebar.warning(message)
 
-# Main layout
-col1, col2 = st.columns([2, 1])
-
-with col1:
-    st.header("📄 1. Upload SOW Document")
-    uploaded_file = st.file_uploader("PDF/DOCX", type=['pdf', 'docx'])
-    if uploaded_file:
-        st.success(f"✅ {uploaded_file.name}")
-        st.session_state.file = uploaded_file
-
-with col2:
-    st.header("📅 2. Project Timeline (Calendar Only)")
-    
-    # ✅ FIXED DATE PICKERS - No timedelta errors
-    today = date.today()
-    
-    build_date = st.date_input(
-        "📌 Build End Date",
-        value=today,
-        min_value=date(2026, 1, 1),
-        key="build_date"
-    )
-    
-    # Fixed: Use timedelta(days=30) correctly
-    test_date = st.date_input(
-        "📌 Test End Date",
-        value=today + timedelta(days=30),  # ✅ CORRECT SYNTAX
-        min_value=build_date,
-        key="test_date"
-    )
-    
-    cutover_date = st.date_input(
-        "📌 Cutover End Date",
-        value=today + timedelta(days=60),  # ✅ CORRECT SYNTAX  
-        min_value=test_date,
-        key="cutover_date"
+if st.sidebar.button("🧹 New Audit (clear session)"):
+    # ✨ One clear() call drops every key at C speed - no per-key
+    # del st.session_state[...] loop to keep in sync with new features
+    executor = st.session_state.get('executor')
+    st.session_state.clear()
+    if executor is not None:
+        executor.shutdown(wait=False)
+    st.rerun()
+
+
+@st.cache_resource
+def get_analyzer():
+    """Single LLMAnalyzer shared across reruns (config never changes mid-session)"""
+    from modules import LLMAnalyzer
+    return LLMAnalyzer()
+
+
+@st.cache_resource
+def get_pillar_checker():
+    """Single PillarChecker shared across reruns"""
+    from modules import PillarChecker
+    return PillarChecker()
+
+
+@st.cache_resource
+def get_report_generator():
+    """Single ReportGenerator shared across reruns (style sheet built once)"""
+    from modules import ReportGenerator
+    return ReportGenerator()
+
+
+@st.cache_resource
+def get_email_notifier():
+    """Single EmailNotifier shared across reruns"""
+    from modules import EmailNotifier
+    return EmailNotifier()
+
+
+@functools.lru_cache(maxsize=8)
+def _file_sig(path):
+    """Cached (basename, mtime) for a generated report - avoids re-running
+    stat/basename on every script rerun once a report exists"""
+    return os.path.basename(path), os.path.getmtime(path)
+
+
+def get_executor():
+    """Shared worker pool for the audit's LLM calls.
+
+    Both DeepSeek calls are network-bound (GIL is released during socket
+    waits), so threads are sufficient — no processes needed.
+    """
+    if 'executor' not in st.session_state:
+        st.session_state.executor = ThreadPoolExecutor(max_workers=4)
+    return st.session_state.executor
+
+
+@st.cache_resource
+def get_parse_cache():
+    """
+    Disk-backed parse cache keyed on a blake2b hash of the upload bytes.
+
+    Parsing (OCR, layout analysis) is the most expensive local stage, and
+    its output is tiny next to the input - entries are stored as
+    zlib-compressed pickles, so re-auditing a known document with a new
+    timeline skips the parse entirely.
+    """
+    try:
+        import diskcache
+        return diskcache.Cache(str(Config.CACHE_DIR / 'parse'))
+    except ImportError:
+        return {}
+
+
+# Parse results survive a week - long enough for iterative redlining
+_PARSE_CACHE_EXPIRE = 7 * 86400
+
+
+@st.cache_resource
+def get_email_outbox():
+    """
+    Process-wide email outbox: a single daemon worker drains the queue,
+    so queueing a send costs microseconds and deliveries from all
+    sessions are serialized over the pooled SMTP connection.
+
+    Returns:
+        Tuple (outbox_queue, status_dict) - the worker records the last
+        delivery outcome per recipient in status_dict
+    """
+    outbox = queue.Queue()
+    status = {}
+
+    def _worker():
+        while True:
+            job = outbox.get()
+            recipient = job['recipient_email']
+            try:
+                get_email_notifier().send_email_with_attachment(**job)
+                status[recipient] = (True, "delivered")
+            except Exception as e:
+                status[recipient] = (False, str(e))
+            finally:
+                outbox.task_done()
+
+    threading.Thread(target=_worker, daemon=True, name="email-outbox").start()
+    return outbox, status
+
+
+@st.cache_resource
+def get_parse_pool():
+    """Separate process for the parse stage - OCR/layout analysis is
+    CPU-bound and would otherwise stall the server's GIL."""
+    return ProcessPoolExecutor(max_workers=1)
+
+
+def _pump_progress(progress, progress_q, futures, stream_pane=None):
+    """
+    Drain worker progress events onto the script thread.
+
+    Workers only ever put() into the queue - all Streamlit calls stay on
+    the main script thread. Queued updates are coalesced so only the
+    latest (value, message) is applied per poll.
+    """
+    pending = list(futures)
+    streamed = []
+    while pending:
+        # FIRST_COMPLETED so completion events surface immediately instead
+        # of waiting out the rest of the poll interval
+        done, pending_set = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+        pending = list(pending_set)
+        latest = None
+        got_stream = False
+        while True:
+            try:
+                event = progress_q.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == 'stream':
+                streamed.append(event[1])
+                got_stream = True
+            else:
+                latest = event
+        if latest is not None:
+            progress.progress(*latest)
+        # ✨ Live token stream - show the tail of the model output as it
+        # arrives (coalesced to one update per poll)
+        if got_stream and stream_pane is not None:
+            stream_pane.text(''.join(streamed)[-1500:])
+    if stream_pane is not None:
+        stream_pane.empty()
+
+
+def perform_audit(uploaded_file, project_timeline, progress):
+    """
+    Run the full audit pipeline:
+    1. Parse SOW document (text + tables)
+    2. Run DeepSeek pillar analysis + SOW content summary IN PARALLEL
+       (both only read document_text/tables, so they are independent)
+    3. Validate and score against the 9 mandatory pillars
+    """
+    # ✨ Small uploads are parsed straight from memory - no temp-file
+    # write/read round-trip. Only unusually large documents spill to disk
+    # so worker-process pickling stays bounded.
+    SPILL_THRESHOLD = 50 * 1024 * 1024
+    file_bytes = uploaded_file.getvalue()
+    tmp_path = None
+    if len(file_bytes) > SPILL_THRESHOLD:
+        suffix = os.path.splitext(uploaded_file.name)[1]
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            tmp.write(file_bytes)
+            tmp_path = tmp.name
+    parse_source = tmp_path if tmp_path else file_bytes
+
+    try:
+        # ✨ Heavy modules are imported here, at point of use, so server
+        # startup doesn't pay for pdfplumber/pytesseract/LLM plumbing
+        from modules.document_parser import parse_document
+        from modules.llm_cache import SemanticLLMCache
+
+        progress.progress(10, "📄 Parsing SOW document...")
+        # ✨ PARSE CACHE - content-addressed, so the same document uploaded
+        # again (even under a new name or timeline) skips OCR/layout work
+        file_hash = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+        parse_cache = get_parse_cache()
+        cached_parse = parse_cache.get(file_hash)
+        if cached_parse is not None:
+            document_text, tables, metadata = pickle.loads(zlib.decompress(cached_parse))
+        else:
+            # ✨ Parse in a worker PROCESS (true parallelism for OCR/regex);
+            # the LLM calls below stay on threads since they are network-bound
+            document_text, tables, metadata = get_parse_pool().submit(
+                parse_document, parse_source, None, uploaded_file.name
+            ).result()
+            blob = zlib.compress(pickle.dumps((document_text, tables, metadata)), 6)
+            try:
+                parse_cache.set(file_hash, blob, expire=_PARSE_CACHE_EXPIRE)
+            except AttributeError:  # plain-dict fallback without diskcache
+                parse_cache[file_hash] = blob
+
+        # ✨ LLM RESPONSE CACHE - repeated audits of the same SOW are free
+        # (exact content-hash first, semantic near-duplicate match second)
+        cache = SemanticLLMCache()
+        analysis_key = SemanticLLMCache.make_key(document_text, project_timeline, 'analyze_sow_v2')
+        summary_key = SemanticLLMCache.make_key(document_text, None, 'sow_content_summary_v1')
+        analysis = cache.get(analysis_key)
+        if analysis is None:
+            analysis = cache.get_semantic(document_text, 'analyze_sow_v2')
+        sow_summary = cache.get(summary_key)
+        if sow_summary is None:
+            sow_summary = cache.get_semantic(document_text, 'sow_content_summary_v1')
+
+        # ✨ PARALLEL LLM CALLS - submit both futures immediately after parsing
+        analyzer = get_analyzer()
+        executor = get_executor()
+        progress.progress(30, "🤖 Running DeepSeek analysis + summary (parallel)...")
+        progress_q = queue.Queue()
+
+        def _tracked(fn, done_value, done_message, *args):
+            result = fn(*args)
+            progress_q.put((done_value, done_message))
+            return result
+
+        analysis_future = None
+        summary_future = None
+        if analysis is None:
+            analysis_future = executor.submit(
+                _tracked,
+                functools.partial(
+                    analyzer.analyze_sow,
+                    on_chunk=lambda s: progress_q.put(('stream', s))
+                ),
+                60, "🤖 Pillar analysis complete...",
+                document_text, project_timeline, tables
+            )
+        if sow_summary is None:
+            summary_future = executor.submit(
+                _tracked, analyzer.generate_sow_content_summary,
+                75, "📝 SOW content summary complete...",
+                document_text, tables
+            )
+
+        # Poll futures + drain progress on the script thread (coalesced),
+        # streaming analysis tokens into a live pane as they arrive
+        stream_pane = st.empty()
+        _pump_progress(progress, progress_q,
+                       [f for f in (analysis_future, summary_future) if f],
+                       stream_pane=stream_pane)
+
+        if analysis_future is not None:
+            analysis = analysis_future.result()
+            cache.set(analysis_key, analysis)
+            cache.set_semantic(document_text, analysis, 'analyze_sow_v2')
+        if summary_future is not None:
+            sow_summary = summary_future.result()
+            cache.set(summary_key, sow_summary)
+            cache.set_semantic(document_text, sow_summary, 'sow_content_summary_v1')
+
+        progress.progress(85, "🛡️ Scoring 9 mandatory pillars...")
+        # ✨ Fused scorecard: validation, score and critical scan in one pass
+        checker = get_pillar_checker()
+        is_valid, validation_message, score, critical_failures = checker.full_scorecard(analysis)
+
+        # ✨ Tally status + risk distributions in one walk and store them
+        # with the results - every later rerun reads the counts instead of
+        # rescanning the pillar list
+        status_counts = Counter()
+        risk_counts = Counter()
+        for pillar in analysis.get('pillars', []):
+            status = pillar.get('status', 'Unknown')
+            risk = pillar.get('risk_level', 'Unknown')
+            status_counts[status] += 1
+            risk_counts[risk] += 1
+            # ✨ Resolve display icons once per audit - reruns just read
+            # the precomputed fields instead of re-consulting icon maps
+            pillar['_status_icon'] = _STATUS_ICON.get(status, "❌")
+            pillar['_risk_icon'] = _RISK_ICON.get(risk, "⚪")
+
+        progress.progress(100, "✅ Audit complete!")
+        return {
+            'analysis': analysis,
+            'sow_summary': sow_summary,
+            'metadata': metadata,
+            'score': score,
+            'status': f"{analysis.get('go_no_go', 'Go')} {'✅' if analysis.get('go_no_go') == 'Go' else '❌'}",
+            'is_valid': is_valid,
+            'validation_message': validation_message,
+            'critical_failures': critical_failures,
+            'status_counts': status_counts,
+            'risk_counts': risk_counts
+        }
+    finally:
+        if tmp_path:
+            os.unlink(tmp_path)
+
+
+@st.fragment
+def render_input_sections():
+    """Build the upload + timeline layout in one declared tree.
+
+    Runs as a fragment: editing a date or the project name reruns only
+    this section, not the whole script (results, findings table, report
+    buttons all stay untouched). Widget values land in session_state via
+    keys, where the audit handler below picks them up.
+    """
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.header("📄 1. Upload SOW Document")
+        uploaded_file = st.file_uploader("PDF/DOCX", type=['pdf', 'docx'], key="sow_upload")
+        if uploaded_file:
+            st.success(f"✅ {uploaded_file.name}")
+            st.session_state.file = uploaded_file
+
+    with col2:
+        st.header("📅 2. Project Timeline (Calendar Only)")
+
+        # ✅ FIXED DATE PICKERS - No timedelta errors
+        # ✨ Compute calendar defaults once per session instead of every rerun
+        # (also keeps them stable if the session crosses midnight)
+        if 'date_defaults' not in st.session_state:
+            today = date.today()
+            st.session_state.date_defaults = {
+                'build': today,
+                'test': today + timedelta(days=30),   # ✅ CORRECT SYNTAX
+                'cutover': today + timedelta(days=60)  # ✅ CORRECT SYNTAX
+            }
+        date_defaults = st.session_state.date_defaults
+
+        build_date = st.date_input(
+            "📌 Build End Date",
+            value=date_defaults['build'],
+            min_value=date(2026, 1, 1),
+            key="build_date"
+        )
+
+        test_date = st.date_input(
+            "📌 Test End Date",
+            value=date_defaults['test'],
+            min_value=build_date,
+            key="test_date"
+        )
+
+        cutover_date = st.date_input(
+            "📌 Cutover End Date",
+            value=date_defaults['cutover'],
+            min_value=test_date,
+            key="cutover_date"
+        )
+
+    # Project details
+    st.markdown("---")
+    st.text_input(
+        "🏢 Project Name",
+        placeholder="Shell Penguins UKCS Divestment",
+        key="project_name_input"
     )
 
-# Project details
-st.markdown("---")
-project_name = st.text_input(
-    "🏢 Project Name",
-    placeholder="Shell Penguins UKCS Divestment"
-)
 
-# Audit button
-if st.button("🚀 AUDIT vs 9 PILLARS", type="primary", use_container_width=True):
-    if uploaded_file and project_name:
-        with st.spinner("Running audit..."):
-            # Simulate your analysis
-            time.sleep(3)
-            
-            st.session_state.results = {
-                'score': 87,
-                'status': 'GO ✅',
-                'pillars': [
-                    '✅ Scope Definition - Met',
-                    '✅ Fixed Cost Structure - Met', 
-                    '⚠️ Timeline Alignment - Partial',
-                    '✅ Vendor SLAs - Met',
-                    '✅ Data Migration - Met',
-                    '✅ Network Separation - Met',
-                    '✅ Knowledge Transfer - Met',
-                    '✅ Contract Termination - Met',
-                    '✅ Fixed Cost Validation - Met'
-                ]
+def render_audit_button(uploaded_file, project_name, build_date, test_date, cutover_date):
+    """Audit trigger + pipeline invocation"""
+    if st.button("🚀 AUDIT vs 9 PILLARS", type="primary", use_container_width=True):
+        if uploaded_file and project_name:
+            # ✨ Memoize on (content hash, timeline): re-clicking the audit
+            # button with identical inputs returns the stored results
+            # instantly instead of re-running the whole pipeline
+            audit_sig = (
+                hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest(),
+                project_name, build_date, test_date, cutover_date
+            )
+            if st.session_state.get('audit_sig') == audit_sig and 'results' in st.session_state:
+                st.success("✅ Audit Complete! (unchanged document and timeline - reused results)")
+                return
+
+            # ✨ Keep real date objects internally - they are formatted exactly
+            # once, at prompt-build time (no strftime/strptime round-trips)
+            project_timeline = {
+                'project_name': project_name,
+                'build_end_date': build_date,
+                'test_end_date': test_date,
+                'cutover_end_date': cutover_date
             }
-            st.success("✅ Audit Complete!")
-    else:
-        st.warning("⚠️ Upload file + project name required")
 
-# Results
-if 'results' in st.session_state:
+            progress = st.progress(0, "Starting audit...")
+            try:
+                st.session_state.results = perform_audit(uploaded_file, project_timeline, progress)
+                st.session_state.project_name = project_name
+                st.session_state.audit_sig = audit_sig
+                st.success("✅ Audit Complete!")
+            except Exception as e:
+                st.error(f"❌ Audit failed: {str(e)}")
+        else:
+            st.warning("⚠️ Upload file + project name required")
+
+
+def render_results():
+    """Results, detailed findings, report download and email actions"""
+    if 'results' not in st.session_state:
+        return
+
+    results = st.session_state.results
+    analysis = results['analysis']
+
     st.header("✅ AUDIT RESULTS")
-    
-    col1, col2 = st.columns(2)
+
+    status_counts = results.get('status_counts', {})
+    risk_counts = results.get('risk_counts', {})
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Compliance Score", f"{st.session_state.results['score']}%")
+        st.metric("Compliance Score", f"{results['score']}%")
     with col2:
-        st.metric("Recommendation", st.session_state.results['status'])
-    
+        st.metric("Recommendation", results['status'])
+    with col3:
+        st.metric("Pillars Met", f"{status_counts.get('Met', 0)}/{sum(status_counts.values())}")
+    with col4:
+        st.metric("Critical/High Risks",
+                  risk_counts.get('Critical', 0) + risk_counts.get('High', 0))
+
+    if not results['is_valid']:
+        st.warning(f"⚠️ {results['validation_message']}")
+
     st.subheader("9 Mandatory Pillars")
-    for pillar in st.session_state.results['pillars']:
-        st.success(pillar)
-    
+    # ✨ Build the whole pillar list as one string and render it once -
+    # a single widget instead of 9 separate success/warning/error elements
+    pillar_lines = [
+        f"{pillar.get('_status_icon', '❌')} **{pillar.get('name', 'Unknown')}** - "
+        f"{pillar.get('status', 'Unknown')} "
+        f"({pillar.get('_risk_icon', '⚪')} {pillar.get('risk_level', 'Unknown')} Risk)"
+        for pillar in analysis.get('pillars', [])
+    ]
+    st.markdown("\n\n".join(pillar_lines))
+
+    # ✨ Detailed findings go in a single virtualized dataframe (its own
+    # scroll region) instead of stacking dozens of widgets into the page
+    detail_rows = get_pillar_checker().format_compliance_table(analysis)
+    if detail_rows:
+        with st.expander("🔍 Detailed Findings (Evidence & Recommendations)"):
+            st.dataframe(detail_rows, use_container_width=True, hide_index=True)
+
+    if results['critical_failures']:
+        st.subheader("🚨 Critical Failures")
+        failure_lines = [
+            f"🔴 **{failure['pillar']}**: {failure['recommendation']}"
+            for failure in results['critical_failures']
+        ]
+        st.error("\n\n".join(failure_lines))
+
+    # ✨ Plain-text report pane: one preformatted string rendered once
+    # (st.text skips per-element markdown parsing entirely)
+    with st.expander("📋 Plain-Text Report"):
+        report_parts = [
+            f"EXECUTIVE SUMMARY\n{analysis.get('executive_summary', 'N/A')}",
+            "CRITICAL RISKS\n" + "\n".join(
+                f"  - {risk}" for risk in analysis.get('critical_risks', [])
+            ) if analysis.get('critical_risks') else "CRITICAL RISKS\n  None identified",
+            "ACTIONABLE REDLINES\n" + "\n".join(
+                f"  - {redline}" for redline in analysis.get('actionable_redlines', [])
+            ) if analysis.get('actionable_redlines') else "ACTIONABLE REDLINES\n  None suggested",
+        ]
+        st.text("\n\n".join(report_parts))
+
     # Actions
     col1, col2 = st.columns(2)
     with col1:
-        st.download_button(
-            "📄 Download PDF",
-            data="PDF report content",
-            file_name=f"SOW_Report_{project_name}.pdf"
-        )
+        if st.button("📄 Generate PDF Report"):
+            with st.spinner("Generating PDF..."):
+                from modules.report_generator import generate_report_bytes
+                # ✨ Build the PDF in the worker process - ReportLab layout
+                # is pure CPU and would otherwise hold the server's GIL
+                pdf_name, pdf_bytes = get_parse_pool().submit(
+                    generate_report_bytes,
+                    analysis,
+                    st.session_state.file.name,
+                    results['metadata'],
+                    results['sow_summary']
+                ).result()
+                # Persist one disk copy for the email path / audit trail
+                os.makedirs('reports', exist_ok=True)
+                pdf_path = os.path.join('reports', pdf_name)
+                with open(pdf_path, 'wb') as out:
+                    out.write(pdf_bytes)
+                st.session_state.pdf_buffer = io.BytesIO(pdf_bytes)
+                st.session_state.pdf_path = pdf_path
+                st.success(f"✅ Report generated: {pdf_name}")
+
+        if 'pdf_buffer' in st.session_state:
+            try:
+                pdf_name, _ = _file_sig(st.session_state.pdf_path)
+            except OSError:
+                pdf_name = None
+            if pdf_name:
+                # ✨ Serve the download straight from the buffer - no
+                # open/read of the report file on every rerun
+                st.session_state.pdf_buffer.seek(0)
+                st.download_button(
+                    "📥 Download PDF",
+                    data=st.session_state.pdf_buffer,
+                    file_name=pdf_name,
+                    mime="application/pdf"
+                )
     with col2:
         email = st.text_input("Email report to")
         if st.button("📧 Send Email") and email:
-            st.success(f"✅ Sent to {email}")
+            if 'pdf_path' not in st.session_state:
+                st.warning("⚠️ Generate the PDF report first")
+            else:
+                # ✨ Drop the job in the outbox and return immediately -
+                # the daemon worker handles the SMTP round-trips
+                outbox, _ = get_email_outbox()
+                outbox.put({
+                    'recipient_email': email,
+                    'subject': f"SOW Audit Report - {st.session_state.project_name}",
+                    'pdf_path': st.session_state.pdf_path,
+                    'compliance_score': results['score'],
+                    'project_name': st.session_state.project_name,
+                    'analysis': analysis
+                })
+                st.session_state.email_recipient = email
+                st.info(f"📤 Queued email to {email}")
+
+        recipient = st.session_state.get('email_recipient')
+        if recipient:
+            _, outbox_status = get_email_outbox()
+            delivered = outbox_status.get(recipient)
+            if delivered is not None:
+                ok, detail = delivered
+                if ok:
+                    st.success(f"✅ Sent to {recipient}")
+                else:
+                    st.error(f"❌ Email to {recipient} failed: {detail}")
+
+
+# ✨ Single declared layout tree - each section is built in exactly one place
+render_input_sections()
+render_audit_button(
+    st.session_state.get('sow_upload'),
+    st.session_state.get('project_name_input', ''),
+    st.session_state.get('build_date'),
+    st.session_state.get('test_date'),
+    st.session_state.get('cutover_date')
+)
+render_results()
 
 st.markdown("---")
 st.markdown("*Made in India 🇮🇳 | Shell Divestment Expert | DeepSeek AI*")
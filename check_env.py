@@ -4,33 +4,35 @@ Run this to diagnose email credential issues
 """
 
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 print("="*70)
 print("🔍 SOW AUDITOR - EMAIL CONFIGURATION DIAGNOSTIC")
 print("="*70)
 
-# Load .env file
-print("\n1. Loading .env file...")
-load_dotenv()
-print("   ✅ load_dotenv() executed")
-
-# Check if .env file exists
+# Read .env file once into a plain dict - no process-environment
+# mutation, no repeated per-key getenv round-trips
+print("\n1. Reading .env file...")
 env_path = os.path.join(os.getcwd(), '.env')
+values = dotenv_values(env_path)
+print("   ✅ dotenv_values() executed")
+
 if os.path.exists(env_path):
     print(f"   ✅ .env file found at: {env_path}")
 else:
     print(f"   ❌ .env file NOT FOUND at: {env_path}")
     print("   ⚠️  YOU NEED TO CREATE .env FILE!")
 
-# Check environment variables
+# Check configured values - the real environment first, then the .env
+# file, matching load_dotenv()'s default precedence in the app (exported
+# vars win over the file)
 print("\n2. Checking environment variables...")
 
-smtp_server = os.getenv('SMTP_SERVER')
-smtp_port = os.getenv('SMTP_PORT')
-smtp_email = os.getenv('SMTP_EMAIL')
-smtp_password = os.getenv('SMTP_PASSWORD')
-deepseek_key = os.getenv('DEEPSEEK_API_KEY')
+smtp_server = os.environ.get('SMTP_SERVER') or values.get('SMTP_SERVER')
+smtp_port = os.environ.get('SMTP_PORT') or values.get('SMTP_PORT')
+smtp_email = os.environ.get('SMTP_EMAIL') or values.get('SMTP_EMAIL')
+smtp_password = os.environ.get('SMTP_PASSWORD') or values.get('SMTP_PASSWORD')
+deepseek_key = os.environ.get('DEEPSEEK_API_KEY') or values.get('DEEPSEEK_API_KEY')
 
 print(f"   SMTP_SERVER: {smtp_server if smtp_server else '❌ NOT SET'}")
 print(f"   SMTP_PORT: {smtp_port if smtp_port else '❌ NOT SET'}")
@@ -3,6 +3,7 @@ Configuration Module for SOW Auditor - Divestment Application
 Complete configuration with ALL required attributes
 """
 
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -29,6 +30,17 @@ class Config:
     DEEPSEEK_MODEL = os.getenv('DEEPSEEK_MODEL', 'deepseek-chat')
     DEEPSEEK_TEMPERATURE = float(os.getenv('DEEPSEEK_TEMPERATURE', '0.3'))
     DEEPSEEK_MAX_TOKENS = int(os.getenv('DEEPSEEK_MAX_TOKENS', '4000'))
+    # Gzip-compress request bodies (15-30 KB prompts shrink ~4-5x); off by
+    # default - enable once the gateway is confirmed to accept gzip bodies
+    DEEPSEEK_ACCEPT_GZIP_BODY = os.getenv('DEEPSEEK_ACCEPT_GZIP_BODY', 'false').lower() == 'true'
+    # Fuse the pillar analysis + content summary into ONE API call - the
+    # document is prefilled once instead of twice (off by default; the
+    # two-call path streams and parallelizes, which suits the UI better)
+    FUSE_LLM_CALLS = os.getenv('FUSE_LLM_CALLS', 'false').lower() == 'true'
+    # Enforce the pillar output via response_format json_schema instead of
+    # the verbose in-prompt example (off by default - needs a gateway that
+    # supports the OpenAI json_schema parameter)
+    DEEPSEEK_JSON_SCHEMA = os.getenv('DEEPSEEK_JSON_SCHEMA', 'false').lower() == 'true'
 
     # ===================================================================
     # EMAIL SMTP CONFIGURATION
@@ -57,6 +69,7 @@ class Config:
     REPORTS_DIR = BASE_DIR / 'reports'
     LOGS_DIR = BASE_DIR / 'logs'
     TEMP_DIR = BASE_DIR / 'temp'
+    CACHE_DIR = BASE_DIR / 'cache'
 
     # ===================================================================
     # LLM CONFIGURATION (legacy support)
@@ -71,6 +84,12 @@ class Config:
     HIGH_RISK_THRESHOLD = 60
     MEDIUM_RISK_THRESHOLD = 80
 
+    # ===================================================================
+    # LLM CACHE SETTINGS
+    # ===================================================================
+    # Minimum cosine similarity for a semantic cache hit (near-duplicate SOWs)
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.95'))
+
     # ===================================================================
     # 9 MANDATORY DIVESTMENT PILLARS (Required by pillar_checker.py)
     # ===================================================================
@@ -86,6 +105,41 @@ class Config:
         "Data Handling"
     ]
 
+    # ===================================================================
+    # PILLAR RESPONSE SCHEMA (Used by llm_analyzer.py when
+    # DEEPSEEK_JSON_SCHEMA is enabled - replaces the in-prompt example,
+    # cutting prompt tokens and guaranteeing parseable output)
+    # ===================================================================
+    PILLAR_RESPONSE_SCHEMA = {
+        'type': 'object',
+        'properties': {
+            'executive_summary': {'type': 'string'},
+            'go_no_go': {'type': 'string', 'enum': ['Go', 'No-Go']},
+            'pillars': {
+                'type': 'array',
+                'minItems': 9,
+                'maxItems': 9,
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'name': {'type': 'string', 'enum': PILLARS},
+                        'status': {'type': 'string', 'enum': ['Met', 'Partial', 'Not Met']},
+                        'risk_level': {'type': 'string', 'enum': ['Critical', 'High', 'Medium', 'Low']},
+                        'evidence': {'type': 'string'},
+                        'recommendation': {'type': 'string'}
+                    },
+                    'required': ['name', 'status', 'risk_level', 'evidence', 'recommendation'],
+                    'additionalProperties': False
+                }
+            },
+            'critical_risks': {'type': 'array', 'items': {'type': 'string'}},
+            'actionable_redlines': {'type': 'array', 'items': {'type': 'string'}}
+        },
+        'required': ['executive_summary', 'go_no_go', 'pillars',
+                     'critical_risks', 'actionable_redlines'],
+        'additionalProperties': False
+    }
+
     # ===================================================================
     # PILLAR DESCRIPTIONS (Required by pillar_checker.py)
     # ===================================================================
@@ -162,15 +216,26 @@ Return response in valid JSON format only. No markdown, no extra text."""
     # ===================================================================
     # CLASS METHODS
     # ===================================================================
+    # Set once the directory tree is known to exist (skips repeat syscalls)
+    _dirs_ready = False
+
     @classmethod
     def create_directories(cls):
         """Create necessary directories if they don't exist"""
-        for directory in [cls.REPORTS_DIR, cls.LOGS_DIR, cls.TEMP_DIR]:
-            directory.mkdir(parents=True, exist_ok=True)
+        if cls._dirs_ready:
+            return
+        for directory in [cls.REPORTS_DIR, cls.LOGS_DIR, cls.TEMP_DIR, cls.CACHE_DIR]:
+            # is_dir() is one stat; mkdir(parents=True) walks the whole
+            # ancestor chain even when the leaf already exists
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ready = True
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def validate_config(cls):
-        """Validate configuration and return status"""
+        """Validate configuration and return status (memoized - env vars
+        are read once at import, so the answer can never change)"""
         errors = []
         warnings = []
 
@@ -5,6 +5,7 @@ Tests your Gmail SMTP credentials and diagnoses connection issues
 
 import smtplib
 import ssl
+from dataclasses import dataclass
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
@@ -23,6 +24,29 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Shared SSLContext - OpenSSL caches TLS session tickets per context, so
+# any reconnect within this process resumes the session (abbreviated
+# handshake) instead of redoing the full key exchange
+_SSL_CTX = ssl.create_default_context()
+
+@dataclass(frozen=True)
+class SmtpCfg:
+    """SMTP settings resolved once - tests receive this instead of
+    re-reading os.getenv (and re-parsing .env) on every call"""
+    server: str
+    port: int
+    email: str
+    password: str
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            server=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
+            port=int(os.getenv('SMTP_PORT', 587)),
+            email=os.getenv('SMTP_EMAIL'),
+            password=os.getenv('SMTP_PASSWORD'),
+        )
+
 def print_header(text):
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{text.center(80)}{Colors.ENDC}")
@@ -78,54 +102,47 @@ def test_env_file():
 
     return True
 
-def test_smtp_connection():
-    """Test 2: Test basic SMTP connection to Gmail"""
-    print_header("TEST 2: Testing SMTP Connection to Gmail")
+def test_smtp_connection(cfg):
+    """Test 2: Test basic SMTP connection to Gmail
 
-    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-    smtp_port = int(os.getenv('SMTP_PORT', 587))
+    Returns the OPEN connection (or None) - the later tests reuse it, so
+    the TCP handshake happens exactly once for the whole checker run.
+    """
+    print_header("TEST 2: Testing SMTP Connection to Gmail")
 
-    print_info(f"Connecting to {smtp_server}:{smtp_port}...")
+    print_info(f"Connecting to {cfg.server}:{cfg.port}...")
 
     try:
         # Create SMTP session
-        server = smtplib.SMTP(smtp_server, smtp_port, timeout=10)
-        print_success(f"Connected to {smtp_server}:{smtp_port}")
+        server = smtplib.SMTP(cfg.server, cfg.port, timeout=10)
+        print_success(f"Connected to {cfg.server}:{cfg.port}")
 
         # Get server response
         response = server.ehlo()
         print_success(f"Server responded: {response[1].decode()[:50]}...")
 
-        server.quit()
-        return True
+        return server
 
     except smtplib.SMTPConnectError as e:
         print_error(f"Connection failed: {str(e)}")
         print_warning("Check if port 587 is blocked by firewall")
-        return False
+        return None
     except Exception as e:
         print_error(f"Connection error: {str(e)}")
-        return False
+        return None
 
-def test_starttls():
-    """Test 3: Test STARTTLS (encryption)"""
+def test_starttls(server):
+    """Test 3: Test STARTTLS (encryption) - upgrades the shared connection"""
     print_header("TEST 3: Testing STARTTLS Encryption")
 
-    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-    smtp_port = int(os.getenv('SMTP_PORT', 587))
-
     try:
-        server = smtplib.SMTP(smtp_server, smtp_port, timeout=10)
-        server.ehlo()
-
         print_info("Starting TLS encryption...")
-        server.starttls()
+        server.starttls(context=_SSL_CTX)
         print_success("TLS encryption started successfully")
 
         server.ehlo()
         print_success("Re-identified after STARTTLS")
 
-        server.quit()
         return True
 
     except Exception as e:
@@ -133,29 +150,21 @@ def test_starttls():
         print_warning("Gmail requires TLS encryption")
         return False
 
-def test_authentication():
-    """Test 4: Test authentication with credentials"""
+def test_authentication(server, cfg):
+    """Test 4: Test authentication on the shared encrypted connection"""
     print_header("TEST 4: Testing Authentication")
 
-    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-    smtp_port = int(os.getenv('SMTP_PORT', 587))
-    smtp_email = os.getenv('SMTP_EMAIL')
-    smtp_password = os.getenv('SMTP_PASSWORD')
-
-    print_info(f"Authenticating as: {smtp_email}")
-    print_info(f"Password length: {len(smtp_password)} characters")
+    print_info(f"Authenticating as: {cfg.email}")
+    print_info(f"Password length: {len(cfg.password)} characters")
 
     try:
-        server = smtplib.SMTP(smtp_server, smtp_port, timeout=10)
-        server.ehlo()
-        server.starttls()
-        server.ehlo()
+        # Cheap liveness probe on the reused connection
+        server.noop()
 
         print_info("Attempting login...")
-        server.login(smtp_email, smtp_password)
+        server.login(cfg.email, cfg.password)
         print_success("✨ Authentication successful! Your credentials are correct.")
 
-        server.quit()
         return True
 
     except smtplib.SMTPAuthenticationError as e:
@@ -173,25 +182,20 @@ def test_authentication():
         print_error(f"Login error: {str(e)}")
         return False
 
-def test_send_test_email():
-    """Test 5: Send actual test email"""
+def test_send_test_email(server, cfg):
+    """Test 5: Send actual test email over the shared connection"""
     print_header("TEST 5: Sending Test Email")
 
-    smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-    smtp_port = int(os.getenv('SMTP_PORT', 587))
-    smtp_email = os.getenv('SMTP_EMAIL')
-    smtp_password = os.getenv('SMTP_PASSWORD')
-
     recipient = input(f"\nEnter recipient email (or press Enter to send to yourself): ").strip()
     if not recipient:
-        recipient = smtp_email
+        recipient = cfg.email
 
     print_info(f"Sending test email to: {recipient}")
 
     try:
         # Create message
         message = MIMEMultipart()
-        message['From'] = smtp_email
+        message['From'] = cfg.email
         message['To'] = recipient
         message['Subject'] = "✅ Gmail SMTP Test - Connection Successful!"
 
@@ -201,9 +205,9 @@ This is a test email from the Gmail SMTP Connection Checker.
 ✅ Your Gmail SMTP configuration is working correctly!
 
 Configuration Details:
-- SMTP Server: {smtp_server}
-- SMTP Port: {smtp_port}
-- Email: {smtp_email}
+- SMTP Server: {cfg.server}
+- SMTP Port: {cfg.port}
+- Email: {cfg.email}
 - Encryption: TLS (STARTTLS)
 
 If you received this email, your SOW Auditor app should be able to send emails successfully.
@@ -214,16 +218,10 @@ Sent from Gmail SMTP Connection Checker
 
         message.attach(MIMEText(body, 'plain'))
 
-        # Connect and send
-        server = smtplib.SMTP(smtp_server, smtp_port, timeout=10)
-        server.ehlo()
-        server.starttls()
-        server.ehlo()
-        server.login(smtp_email, smtp_password)
-
+        # Send over the already-authenticated connection - no second
+        # TCP/TLS/AUTH round-trip
         print_info("Sending email...")
         server.send_message(message)
-        server.quit()
 
         print_success(f"✨ Test email sent successfully to {recipient}!")
         print_info("Check your inbox (and spam folder)")
@@ -233,7 +231,7 @@ Sent from Gmail SMTP Connection Checker
         print_error(f"Failed to send email: {str(e)}")
         return False
 
-def show_diagnostics():
+def show_diagnostics(cfg=None):
     """Show diagnostic information"""
     print_header("DIAGNOSTIC INFORMATION")
 
@@ -249,10 +247,9 @@ def show_diagnostics():
     else:
         print_error(".env file not found")
 
-    # Check environment variables
-    load_dotenv()
-    smtp_email = os.getenv('SMTP_EMAIL')
-    smtp_password = os.getenv('SMTP_PASSWORD')
+    # Check resolved credentials (cfg is None when the .env check failed
+    # before main() could build it)
+    smtp_password = cfg.password if cfg else None
 
     if smtp_password:
         print_info(f"Password format check:")
@@ -293,52 +290,63 @@ SMTP_PASSWORD=your-16-char-app-password
         show_diagnostics()
         return
 
-    # Test 2: SMTP connection
-    result2 = test_smtp_connection()
-    test_results.append(("SMTP Connection", result2))
+    # Resolve credentials ONCE - every test below reads from this frozen
+    # config instead of hitting os.getenv (and int()) repeatedly
+    cfg = SmtpCfg.from_env()
+
+    # Test 2: SMTP connection - the returned connection is shared by the
+    # remaining tests (one TCP + TLS + AUTH sequence for the whole run)
+    server = test_smtp_connection(cfg)
+    test_results.append(("SMTP Connection", server is not None))
 
-    if not result2:
+    if server is None:
         print_error("\n❌ Cannot connect to Gmail SMTP server")
         print_warning("Check your internet connection and firewall settings")
-        show_diagnostics()
-        return
-
-    # Test 3: STARTTLS
-    result3 = test_starttls()
-    test_results.append(("STARTTLS", result3))
-
-    if not result3:
-        print_error("\n❌ TLS encryption failed")
-        show_diagnostics()
+        show_diagnostics(cfg)
         return
 
-    # Test 4: Authentication
-    result4 = test_authentication()
-    test_results.append(("Authentication", result4))
-
-    if not result4:
-        print_error("\n❌ Authentication failed - THIS IS YOUR PROBLEM!")
-        print_warning("\n📋 SOLUTION STEPS:")
-        print("1. Go to: https://myaccount.google.com/apppasswords")
-        print("2. Sign in to your Gmail account")
-        print("3. Generate NEW App Password:")
-        print("   - Select app: Mail")
-        print("   - Select device: Other (Custom name)")
-        print("   - Name it: SOW Auditor")
-        print("   - Click Generate")
-        print("4. Copy the 16-character password (REMOVE SPACES!)")
-        print("5. Update SMTP_PASSWORD in your .env file")
-        print("6. Run this checker again")
-        show_diagnostics()
-        return
-
-    # Test 5: Send test email
-    print_success("\n✨ All authentication tests passed!")
-
-    send_test = input("\nDo you want to send a test email? (y/n): ").strip().lower()
-    if send_test == 'y':
-        result5 = test_send_test_email()
-        test_results.append(("Send Test Email", result5))
+    try:
+        # Test 3: STARTTLS
+        result3 = test_starttls(server)
+        test_results.append(("STARTTLS", result3))
+
+        if not result3:
+            print_error("\n❌ TLS encryption failed")
+            show_diagnostics(cfg)
+            return
+
+        # Test 4: Authentication
+        result4 = test_authentication(server, cfg)
+        test_results.append(("Authentication", result4))
+
+        if not result4:
+            print_error("\n❌ Authentication failed - THIS IS YOUR PROBLEM!")
+            print_warning("\n📋 SOLUTION STEPS:")
+            print("1. Go to: https://myaccount.google.com/apppasswords")
+            print("2. Sign in to your Gmail account")
+            print("3. Generate NEW App Password:")
+            print("   - Select app: Mail")
+            print("   - Select device: Other (Custom name)")
+            print("   - Name it: SOW Auditor")
+            print("   - Click Generate")
+            print("4. Copy the 16-character password (REMOVE SPACES!)")
+            print("5. Update SMTP_PASSWORD in your .env file")
+            print("6. Run this checker again")
+            show_diagnostics(cfg)
+            return
+
+        # Test 5: Send test email
+        print_success("\n✨ All authentication tests passed!")
+
+        send_test = input("\nDo you want to send a test email? (y/n): ").strip().lower()
+        if send_test == 'y':
+            result5 = test_send_test_email(server, cfg)
+            test_results.append(("Send Test Email", result5))
+    finally:
+        try:
+            server.quit()
+        except Exception:
+            pass
 
     # Summary
     print_header("TEST SUMMARY")
@@ -1,20 +1,41 @@
 """
 Divestment SOW Auditor Modules
 Enhanced components for IT contract analysis
+
+Submodules are imported lazily (PEP 562) so that importing the package
+doesn't pay for pdfplumber/reportlab/pytesseract until a component is
+actually used.
 """
 
-from .document_parser import DocumentParser
-from .llm_analyzer import LLMAnalyzer
-from .pillar_checker import PillarChecker
-from .report_generator import ReportGenerator
-from .email_notification import EmailNotifier
+_LAZY_IMPORTS = {
+    'DocumentParser': 'document_parser',
+    'LLMAnalyzer': 'llm_analyzer',
+    'PillarChecker': 'pillar_checker',
+    'ReportGenerator': 'report_generator',
+    'EmailNotifier': 'email_notification',
+    'LLMCache': 'llm_cache',
+    'SemanticLLMCache': 'llm_cache',
+}
 
 __all__ = [
     'DocumentParser',
-    'LLMAnalyzer', 
+    'LLMAnalyzer',
     'PillarChecker',
     'ReportGenerator',
-    'EmailNotifier'
+    'EmailNotifier',
+    'LLMCache',
+    'SemanticLLMCache'
 ]
 
 __version__ = '2.0.0'
+
+
+def __getattr__(name):
+    """Resolve component classes on first access instead of at import time"""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        module = import_module(f'.{_LAZY_IMPORTS[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
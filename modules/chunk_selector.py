@@ -0,0 +1,120 @@
+"""
+Chunk Selector Module
+Picks the SOW paragraphs most relevant to the 9 mandatory pillars
+
+Fixed head-truncation (text[:15000]) pays prompt tokens for table-of-
+contents and legal preamble while risking cutting off the pricing or
+schedule sections further in. Scoring paragraphs against per-pillar
+keyword bags keeps the prompt to a few thousand high-signal characters.
+"""
+
+import math
+import re
+from config import Config
+
+# Optional BM25 ranking - the keyword-overlap fallback is close enough
+# for clause-heavy contract text when rank_bm25 is not installed
+try:
+    from rank_bm25 import BM25Okapi
+    _BM25_AVAILABLE = True
+except ImportError:
+    _BM25_AVAILABLE = False
+
+_WORD_RE = re.compile(r'\w+')
+
+# Terms too common in contract text to discriminate between sections
+_STOPWORDS = frozenset(
+    'the a an and or of for to in with no not be is are must shall '
+    'if on by between both each'.split()
+)
+
+
+def _tokenize(text):
+    """Lowercase word tokens, stopwords removed"""
+    return [t for t in _WORD_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _pillar_queries():
+    """Keyword bag per pillar, built from the pillar name + description"""
+    return {
+        name: _tokenize(f"{name} {description}")
+        for name, description in Config.PILLAR_DESCRIPTIONS.items()
+    }
+
+
+# Built once at import - Config.PILLAR_DESCRIPTIONS is static
+_PILLAR_QUERIES = _pillar_queries()
+
+
+def _fallback_scores(paragraph_tokens, query):
+    """TF-weighted keyword overlap, length-normalized - used when
+    rank_bm25 is absent"""
+    query_set = set(query)
+    scores = []
+    for tokens in paragraph_tokens:
+        if not tokens:
+            scores.append(0.0)
+            continue
+        hits = sum(1 for t in tokens if t in query_set)
+        scores.append(hits / math.log(len(tokens) + 2))
+    return scores
+
+
+def select_relevant_chunks(document_text, budget_chars=6000, top_k=3):
+    """
+    Select the paragraphs most relevant to the mandatory pillars.
+
+    Each pillar's keyword bag ranks all paragraphs; the union of every
+    pillar's top_k is concatenated in document order up to budget_chars,
+    so every pillar gets its best evidence into the prompt.
+
+    Args:
+        document_text: Full extracted SOW text
+        budget_chars: Maximum characters of selected text
+        top_k: Paragraphs kept per pillar before the union
+
+    Returns:
+        str: Selected text (the unchanged document when already in budget)
+    """
+    if len(document_text) <= budget_chars:
+        return document_text
+
+    paragraphs = [p for p in re.split(r'\n\s*\n', document_text) if p.strip()]
+    if len(paragraphs) < 2:
+        # No paragraph structure to rank (e.g. single-block OCR output)
+        return document_text[:budget_chars]
+
+    paragraph_tokens = [_tokenize(p) for p in paragraphs]
+    bm25 = BM25Okapi([t or ['_'] for t in paragraph_tokens]) if _BM25_AVAILABLE else None
+
+    selected = set()
+    for query in _PILLAR_QUERIES.values():
+        if bm25 is not None:
+            scores = bm25.get_scores(query)
+        else:
+            scores = _fallback_scores(paragraph_tokens, query)
+        ranked = sorted(
+            (i for i in range(len(paragraphs)) if scores[i] > 0),
+            key=lambda i: scores[i], reverse=True
+        )
+        selected.update(ranked[:top_k])
+
+    if not selected:
+        # Nothing matched any pillar keyword (non-English or badly
+        # OCR-garbled text) - better a head-truncated prompt than none
+        return document_text[:budget_chars]
+
+    # Document order keeps cross-references readable for the model
+    chunks = []
+    used = 0
+    for idx in sorted(selected):
+        paragraph = paragraphs[idx]
+        if used + len(paragraph) > budget_chars:
+            remaining = budget_chars - used
+            if remaining > 200:  # partial paragraphs shorter than this are noise
+                chunks.append(paragraph[:remaining])
+            break
+        chunks.append(paragraph)
+        used += len(paragraph) + 2
+
+    return "\n\n".join(chunks)
@@ -4,22 +4,183 @@ Document Parser Module - Enhanced with OCR and Table Extraction
 
 import PyPDF2
 from docx import Document
+from pdfminer.high_level import extract_text as pdfminer_extract_text
 import os
 import pdfplumber
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, convert_from_bytes
 from PIL import Image
 import re
+import io
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _page_has_table_hints(page):
+    """
+    Cheap check for table ruling lines/rects on a page.
+
+    pdfplumber's default table finder is line-based, so a page that draws
+    no lines or rects cannot yield a table - skipping extract_tables()
+    there avoids the second-slowest PDF operation after OCR.
+    """
+    try:
+        return bool(page.lines or page.rects)
+    except Exception:
+        return True  # when in doubt, extract
+
+
+def _extract_page(page_num, page):
+    """
+    Extract (page_num, text, tables) with one layout pass per page.
+
+    find_tables() locates table bounds from ruling lines and its cell
+    extraction reuses the page's cached .chars dictionary; calling
+    extract_text() afterwards hits the same cache, so the expensive char
+    clustering runs once per page instead of once per output kind.
+    Table extraction stays gated on the cheap ruling-line hint check.
+    """
+    page_tables = []
+    if _page_has_table_hints(page):
+        page_tables = [table.extract() for table in page.find_tables()]
+    return page_num, page.extract_text(), page_tables
+
+
+# LSTM-only engine with a uniform-text-block assumption: skips Tesseract's
+# legacy recognizer and automatic page segmentation, both wasted on SOWs
+_OCR_CONFIG = '--oem 1 --psm 6'
+
+
+def _ocr_page(image_or_path):
+    """
+    OCR a single page image, returning (text, mean_confidence).
+
+    Module-level so it is picklable for ProcessPoolExecutor - Tesseract's
+    LSTM recognizer is pure CPU, so pages scale linearly across cores.
+    image_to_data yields per-word confidences alongside the text, letting
+    the caller decide whether a low-DPI pass was good enough.
+    """
+    if isinstance(image_or_path, str):
+        with Image.open(image_or_path) as image:
+            data = pytesseract.image_to_data(
+                image, lang='eng', config=_OCR_CONFIG,
+                output_type=pytesseract.Output.DICT)
+    else:
+        data = pytesseract.image_to_data(
+            image_or_path, lang='eng', config=_OCR_CONFIG,
+            output_type=pytesseract.Output.DICT)
+
+    lines = []
+    current_key = None
+    confidences = []
+    for i, word in enumerate(data['text']):
+        conf = int(float(data['conf'][i]))
+        if conf < 0 or not word.strip():
+            continue
+        confidences.append(conf)
+        key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        if key != current_key:
+            lines.append([])
+            current_key = key
+        lines[-1].append(word)
+
+    text = "\n".join(" ".join(words) for words in lines)
+    mean_conf = sum(confidences) / len(confidences) if confidences else 0.0
+    return text, mean_conf
+
+
+def _parse_pdf_page_range(source, page_numbers):
+    """
+    Worker function: extract text + tables for a range of PDF pages.
+
+    Module-level so it is picklable for ProcessPoolExecutor. Each worker
+    opens its own pdfplumber handle (page objects don't cross processes).
+    source is a file path or raw PDF bytes - both pickle cleanly.
+    """
+    results = []
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        for page_num in page_numbers:
+            results.append(_extract_page(page_num, pdf.pages[page_num - 1]))
+    return results
+
+
+def parse_document(source, workers=None, filename=None, want_tables=True):
+    """
+    Top-level parse entry point - picklable, so callers can run the whole
+    CPU-bound parse stage (OCR, layout analysis) in a separate process
+    while keeping their own process free for I/O-bound work.
+
+    Args:
+        source: File path, raw bytes, or readable file-like object
+        workers: Optional worker count for page-parallel PDF parsing
+        filename: Original filename (required when source is not a path -
+            the extension decides the parse route)
+        want_tables: When False, text-dense PDFs take a fast extraction
+            path that skips pdfplumber's layout engine entirely
+
+    Returns:
+        Tuple (content, tables, metadata)
+    """
+    parser = DocumentParser(source, workers=workers, filename=filename,
+                            want_tables=want_tables)
+    content = parser.parse()
+    return content, parser.extract_tables(), parser.get_metadata()
+
 
 class DocumentParser:
     """Enhanced document parser with OCR and table extraction support"""
 
-    def __init__(self, file_path):
-        self.file_path = file_path
-        self.file_extension = os.path.splitext(file_path)[1].lower()
+    # Minimum page count before process-parallel parsing pays for pool spin-up
+    PARALLEL_PAGE_THRESHOLD = 8
+
+    # Recognition time scales with pixel count, so start at 200 DPI
+    # (~2.25x fewer pixels than 300) and re-run only low-confidence pages
+    # at the higher resolution
+    OCR_BASE_DPI = 200
+    OCR_RETRY_DPI = 300
+    OCR_MIN_CONFIDENCE = 70
+
+    # Fewer chars than this across the first two pages means no real text
+    # layer - the document is scanned and OCR is the only route
+    SCANNED_PEEK_CHAR_THRESHOLD = 200
+
+    def __init__(self, source, workers=None, filename=None, want_tables=True):
+        """
+        Args:
+            source: File path (str/PathLike), raw bytes, or a readable
+                file-like object - uploads can be parsed straight from
+                memory without a temp-file round-trip
+            workers: Worker count for page-parallel PDF parsing
+            filename: Original filename when source is not a path
+            want_tables: Whether table extraction is required; False
+                unlocks the fast no-layout PDF path
+        """
+        if isinstance(source, (str, os.PathLike)):
+            self.file_path = os.fspath(source)
+            self._file_bytes = None
+        else:
+            self.file_path = None
+            self._file_bytes = source if isinstance(source, bytes) else source.read()
+        self.filename = filename or (os.path.basename(self.file_path) if self.file_path else 'upload')
+        self.file_extension = os.path.splitext(self.filename)[1].lower()
         self.content = ""
         self.tables = []
         self.is_scanned = False
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.want_tables = want_tables
+        self._page_count = None  # recorded during parsing, reused by metadata
+
+    def _read_file_bytes(self):
+        """Read the document into memory once; later consumers reuse the buffer"""
+        if self._file_bytes is None:
+            with open(self.file_path, 'rb') as file:
+                self._file_bytes = file.read()
+        return self._file_bytes
+
+    def _pdf_source(self):
+        """Source usable by pdfplumber/pdf2image: path when on disk,
+        the in-memory buffer otherwise"""
+        return self.file_path if self.file_path else self._file_bytes
 
     def parse(self):
         """Parse PDF or DOCX file with OCR fallback"""
@@ -30,31 +191,117 @@ class DocumentParser:
         else:
             raise ValueError(f"Unsupported file format: {self.file_extension}")
 
+    def _try_fast_pypdf2(self):
+        """
+        Cheap PyPDF2 text extraction plus a quality heuristic.
+
+        PyPDF2 skips layout clustering entirely, making it 5-10x faster
+        than pdfplumber on digitally-born PDFs - but it returns garbage
+        (or nothing) on scanned or oddly-encoded documents, so the result
+        only counts when it looks like real prose.
+
+        Returns:
+            Tuple (text, has_good_signal)
+        """
+        try:
+            reader = PyPDF2.PdfReader(io.BytesIO(self._read_file_bytes()))
+            self._page_count = len(reader.pages)
+            text = "\n".join(page.extract_text() or '' for page in reader.pages)
+        except Exception as e:
+            print(f"Fast PyPDF2 pass failed: {str(e)}")
+            return "", False
+
+        return text, self._text_has_good_signal(text)
+
+    @staticmethod
+    def _text_has_good_signal(text):
+        """Heuristic: does extracted text look like real prose (vs the
+        garbage that scanned/oddly-encoded PDFs produce)?"""
+        sample = text[:2000]
+        return (
+            len(text.split()) > 50 and
+            bool(sample) and
+            sum(c.isalpha() for c in sample) / len(sample) > 0.6
+        )
+
+    def _try_pdfminer_text(self):
+        """
+        pdfminer.six text extraction without pdfplumber's layout layer.
+
+        pdfplumber wraps pdfminer and adds word/char clustering that only
+        table extraction needs; calling pdfminer's high-level API directly
+        skips that work while handling the encodings PyPDF2 trips over.
+        Always available - pdfminer.six is a pdfplumber dependency.
+        """
+        try:
+            text = pdfminer_extract_text(
+                self.file_path if self.file_path else io.BytesIO(self._read_file_bytes())
+            )
+        except Exception as e:
+            print(f"pdfminer pass failed: {str(e)}")
+            return "", False
+        return text, self._text_has_good_signal(text)
+
     def _parse_pdf_enhanced(self):
         """Enhanced PDF parsing with OCR for scanned documents"""
         try:
+            # ✨ Fast path: when the caller doesn't need tables, a clean
+            # PyPDF2 extraction makes pdfplumber's layout engine redundant
+            if not self.want_tables:
+                fast_text, has_good_signal = self._try_fast_pypdf2()
+                if has_good_signal:
+                    self.content = fast_text
+                    return self.content
+                # Second rung: pdfminer handles encodings PyPDF2 chokes
+                # on, still without pdfplumber's layout reconstruction
+                fast_text, has_good_signal = self._try_pdfminer_text()
+                if has_good_signal:
+                    self.content = fast_text
+                    return self.content
+
             # Standard text extraction with pdfplumber
             text_content = []
             tables_content = []
 
-            with pdfplumber.open(self.file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text_content.append(f"\n--- Page {page_num} ---\n{page_text}")
-
-                    # Extract tables
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        for table_num, table in enumerate(page_tables, 1):
-                            self.tables.append({
-                                'page': page_num,
-                                'table_num': table_num,
-                                'data': table
-                            })
-                            table_text = self._format_table_as_text(table)
-                            tables_content.append(f"\n[TABLE {table_num} on Page {page_num}]\n{table_text}")
+            source = self.file_path if self.file_path else io.BytesIO(self._file_bytes)
+            with pdfplumber.open(source) as pdf:
+                page_count = len(pdf.pages)
+                self._page_count = page_count
+
+                # ✨ Scanned-document peek: a PDF with almost no chars on
+                # its first pages has no text layer to extract, so skip
+                # the full pdfplumber pass and go straight to OCR instead
+                # of discovering the same thing after parsing every page
+                peek_chars = sum(len(p.chars) for p in pdf.pages[:2])
+                if peek_chars < self.SCANNED_PEEK_CHAR_THRESHOLD:
+                    print("⚠️ No text layer detected on first pages. Going straight to OCR...")
+                    self.is_scanned = True
+                    self.content = self._perform_ocr()
+                    return self.content
+
+                if page_count >= self.PARALLEL_PAGE_THRESHOLD and self.workers > 1:
+                    # ✨ Page-parallel parse: text/table extraction is CPU-bound
+                    # and per-page independent, so processes scale with cores
+                    page_results = self._parse_pages_parallel(page_count)
+                else:
+                    page_results = [
+                        _extract_page(page_num, page)
+                        for page_num, page in enumerate(pdf.pages, 1)
+                    ]
+
+            for page_num, page_text, page_tables in page_results:
+                if page_text and page_text.strip():
+                    text_content.append(f"\n--- Page {page_num} ---\n{page_text}")
+
+                if page_tables:
+                    for table_num, table in enumerate(page_tables, 1):
+                        self.tables.append({
+                            'page': page_num,
+                            'table_num': table_num,
+                            'data': table
+                        })
+                        table_text = self._format_table_as_text(table)
+                        tables_content.append(f"\n[TABLE {table_num} on Page {page_num}]\n{table_text}")
 
             combined_text = "\n".join(text_content + tables_content)
 
@@ -74,16 +321,43 @@ class DocumentParser:
             print(f"pdfplumber failed, trying PyPDF2: {str(e)}")
             return self._parse_pdf_fallback()
 
+    def _parse_pages_parallel(self, page_count):
+        """
+        Split pages into per-worker ranges and parse them in a process pool
+
+        Processes rather than threads: pdfminer's char-emission loops are
+        pure Python and hold the GIL throughout, so a thread pool here
+        serializes the hot path. Range-per-worker submission keeps the
+        pickling cost to one source handoff per worker.
+
+        Returns:
+            List of (page_num, page_text, page_tables) sorted by page number
+        """
+        workers = min(self.workers, page_count)
+        ranges = [list(range(i + 1, page_count + 1, workers)) for i in range(workers)]
+
+        page_results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_parse_pdf_page_range, self._pdf_source(), page_numbers)
+                for page_numbers in ranges if page_numbers
+            ]
+            for future in futures:
+                page_results.extend(future.result())
+
+        page_results.sort(key=lambda item: item[0])
+        return page_results
+
     def _parse_pdf_fallback(self):
         """Fallback PDF parsing using PyPDF2"""
         try:
-            with open(self.file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = []
-                for page in pdf_reader.pages:
-                    text.append(page.extract_text())
-                self.content = "\n".join(text)
-                return self.content
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(self._read_file_bytes()))
+            self._page_count = len(pdf_reader.pages)
+            text = []
+            for page in pdf_reader.pages:
+                text.append(page.extract_text())
+            self.content = "\n".join(text)
+            return self.content
         except Exception as e:
             raise Exception(f"Error parsing PDF: {str(e)}")
 
@@ -91,14 +365,50 @@ class DocumentParser:
         """Perform OCR on scanned PDF pages"""
         try:
             print("Converting PDF to images for OCR...")
-            images = convert_from_path(self.file_path, dpi=300)
+            workers = self.workers
+            # ✨ Rasterize into a temp dir and work with PATHS: holding
+            # every 300-DPI page as a PIL object costs ~25 MB per page,
+            # and paths pickle to the OCR workers in bytes, not megabytes.
+            # Pages are opened one at a time inside _ocr_page.
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # thread_count parallelizes pdftoppm rasterization as well
+                raster_args = dict(dpi=self.OCR_BASE_DPI, thread_count=workers,
+                                   output_folder=tmp_dir, paths_only=True, fmt='png')
+                if self.file_path:
+                    paths = convert_from_path(self.file_path, **raster_args)
+                else:
+                    paths = convert_from_bytes(self._read_file_bytes(), **raster_args)
+
+                if len(paths) == 1 or workers <= 1:
+                    # Pool spin-up doesn't pay for a single page
+                    results = [_ocr_page(path) for path in paths]
+                else:
+                    # ✨ Page-parallel OCR - independent pages, CPU-bound work
+                    print(f"Running OCR on {len(paths)} pages across {min(workers, len(paths))} workers...")
+                    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                        results = list(pool.map(_ocr_page, paths))
 
-            ocr_text = []
-            for page_num, image in enumerate(images, 1):
-                print(f"Processing page {page_num}/{len(images)} with OCR...")
-                page_text = pytesseract.image_to_string(image, lang='eng')
-                ocr_text.append(f"\n--- Page {page_num} (OCR) ---\n{page_text}")
+                # ✨ Escalate only the pages the fast pass couldn't read -
+                # re-rasterize those individually at the higher DPI
+                for idx, (page_text, confidence) in enumerate(results):
+                    if confidence >= self.OCR_MIN_CONFIDENCE:
+                        continue
+                    page_no = idx + 1
+                    print(f"Page {page_no} OCR confidence {confidence:.0f} - retrying at {self.OCR_RETRY_DPI} DPI...")
+                    retry_args = dict(dpi=self.OCR_RETRY_DPI, output_folder=tmp_dir,
+                                      paths_only=True, fmt='png',
+                                      first_page=page_no, last_page=page_no)
+                    if self.file_path:
+                        retry_paths = convert_from_path(self.file_path, **retry_args)
+                    else:
+                        retry_paths = convert_from_bytes(self._read_file_bytes(), **retry_args)
+                    if retry_paths:
+                        results[idx] = _ocr_page(retry_paths[0])
 
+            ocr_text = [
+                f"\n--- Page {page_num} (OCR) ---\n{page_text}"
+                for page_num, (page_text, _confidence) in enumerate(results, 1)
+            ]
             return "\n".join(ocr_text)
 
         except Exception as e:
@@ -111,17 +421,17 @@ class DocumentParser:
         if not table:
             return ""
 
-        formatted_rows = []
-        for row in table:
-            cleaned_row = [str(cell).strip() if cell else "" for cell in row]
-            formatted_rows.append(" | ".join(cleaned_row))
-
-        return "\n".join(formatted_rows)
+        # Single expression feeding generators straight into the joins -
+        # no intermediate per-row list, less per-cell overhead
+        return "\n".join(
+            " | ".join("" if cell is None else str(cell).strip() for cell in row)
+            for row in table
+        )
 
     def _parse_docx(self):
         """Enhanced DOCX parsing with table support"""
         try:
-            doc = Document(self.file_path)
+            doc = Document(self.file_path if self.file_path else io.BytesIO(self._read_file_bytes()))
             text = []
 
             # Extract paragraphs
@@ -129,18 +439,17 @@ class DocumentParser:
                 if paragraph.text.strip():
                     text.append(paragraph.text)
 
-            # Extract tables
+            # Extract tables - one walk per table feeds both the text
+            # rendering and the stored data, so each cell.text (which
+            # traverses the underlying XML in python-docx) runs once
             for table_num, table in enumerate(doc.tables, 1):
-                table_text = f"\n[TABLE {table_num}]\n"
-                for row in table.rows:
-                    row_text = " | ".join([cell.text.strip() for cell in row.cells])
-                    table_text += row_text + "\n"
-                text.append(table_text)
-
-                # Store table data
+                parts = [f"\n[TABLE {table_num}]\n"]
                 table_data = []
                 for row in table.rows:
-                    table_data.append([cell.text.strip() for cell in row.cells])
+                    cells = [cell.text.strip() for cell in row.cells]
+                    table_data.append(cells)
+                    parts.append(" | ".join(cells) + "\n")
+                text.append("".join(parts))
                 self.tables.append({
                     'table_num': table_num,
                     'data': table_data
@@ -154,10 +463,13 @@ class DocumentParser:
 
     def get_metadata(self):
         """Return file metadata"""
-        file_size = os.path.getsize(self.file_path) / (1024 * 1024)
+        if self.file_path:
+            file_size = os.path.getsize(self.file_path) / (1024 * 1024)
+        else:
+            file_size = len(self._file_bytes) / (1024 * 1024)
 
         return {
-            'filename': os.path.basename(self.file_path),
+            'filename': self.filename,
             'size_mb': round(file_size, 2),
             'format': self.file_extension,
             'word_count': len(self.content.split()),
@@ -167,15 +479,20 @@ class DocumentParser:
         }
 
     def _get_page_count(self):
-        """Get page count from PDF"""
-        if self.file_extension == '.pdf':
-            try:
-                with open(self.file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    return len(pdf_reader.pages)
-            except:
-                return 0
-        return 1
+        """Get page count from PDF (recorded during parsing - opening the
+        document a second time just to count pages is a full trailer/xref
+        parse for a number we already had)"""
+        if self.file_extension != '.pdf':
+            return 1
+        if self._page_count is not None:
+            return self._page_count
+        try:
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(self._read_file_bytes()))
+            self._page_count = len(pdf_reader.pages)
+            return self._page_count
+        except Exception as e:
+            print(f"⚠️ Page count failed: {str(e)}")
+            return 0
 
     def extract_tables(self):
         """Return extracted tables"""
@@ -4,10 +4,94 @@ Analyzes SOW documents using 9 Mandatory Divestment Pillars
 NOW WITH SOW CONTENT SUMMARY GENERATION
 """
 
+import asyncio
+import gzip
+import random
 import requests
 import json
+import re
+import threading
 from config import Config
 from datetime import datetime
+from modules.chunk_selector import select_relevant_chunks
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional HTTP/2 transport - one TLS connection multiplexes concurrent
+# API calls instead of opening a socket per request
+try:
+    import httpx
+    try:
+        import h2  # noqa: F401 - httpx needs the 'http2' extra for HTTP/2
+        _HTTP2_AVAILABLE = True
+    except ImportError:
+        _HTTP2_AVAILABLE = False
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    _HTTP2_AVAILABLE = False
+
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + \
+    ((httpx.TimeoutException,) if HTTPX_AVAILABLE else ())
+_REQUEST_ERRORS = (requests.exceptions.RequestException,) + \
+    ((httpx.HTTPError,) if HTTPX_AVAILABLE else ())
+
+# Optional C-speed JSON - matters for the multi-KB prompts/responses and
+# the per-delta parses on the streaming path
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _json_loads(text):
+    """orjson when installed (its JSONDecodeError subclasses stdlib's),
+    stdlib json otherwise"""
+    return orjson.loads(text) if _ORJSON_AVAILABLE else json.loads(text)
+
+
+# Strict-schema response_format for the pillar analysis, sent when
+# Config.DEEPSEEK_JSON_SCHEMA is enabled (built once - the schema and
+# the flag are static)
+_PILLAR_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'sow_audit',
+        'schema': Config.PILLAR_RESPONSE_SCHEMA,
+        'strict': True
+    }
+} if Config.DEEPSEEK_JSON_SCHEMA else None
+
+
+# Last tables object and its pretty-printed JSON - the summary call and
+# its truncation retry re-serialize the same structure otherwise, which
+# for a 200-row table is hundreds of KB of string work per call. Keyed
+# by identity; holding the reference keeps the 'is' check sound.
+_tables_memo = (None, '')
+
+
+def _serialize_tables(tables):
+    """Indented tables JSON for the prompt, memoized on the last tables
+    object (orjson when installed - ~5-10x faster on nested structures)"""
+    global _tables_memo
+    if _tables_memo[0] is tables:
+        return _tables_memo[1]
+    if _ORJSON_AVAILABLE:
+        text = orjson.dumps(tables, option=orjson.OPT_INDENT_2).decode()
+    else:
+        text = json.dumps(tables, indent=2)
+    _tables_memo = (tables, text)
+    return text
+
+
+# JSON object inside markdown fences, and a bare-object fallback - both
+# precompiled once. They are searched in that order: a single combined
+# alternation would let stray braces in prose BEFORE a fence win, since
+# re matches at the earliest position rather than the first alternative
+_FENCED_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_BARE_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 class LLMAnalyzer:
     """DeepSeek AI integration for divestment SOW analysis"""
@@ -18,8 +102,139 @@ class LLMAnalyzer:
         self.model = Config.DEEPSEEK_MODEL
         self.max_tokens = Config.DEEPSEEK_MAX_TOKENS
         self.temperature = Config.DEEPSEEK_TEMPERATURE
+        self._client = None
+        self._aclient = None
+        self._client_lock = threading.Lock()
+
+        # Last fused analyze+summarize result, keyed by document hash -
+        # lets the legacy two-method callers share one fused API call
+        # when Config.FUSE_LLM_CALLS is set (see analyze_and_summarize)
+        self._fused_lock = threading.Lock()
+        self._fused_last = None
+
+        # Payload skeleton + the multi-KB system message built once -
+        # per-call work is a dict copy and one small user-message dict
+        self._base_payload = {
+            'model': self.model,
+            'temperature': self.temperature,
+            'max_tokens': self.max_tokens
+        }
+        self._base_messages = [{'role': 'system', 'content': Config.SYSTEM_PROMPT}]
+
+        # ✨ Persistent session for the requests fallback path - urllib3
+        # keeps the TLS connection alive between calls, so only the first
+        # request pays the handshake. Retries cover transient gateway
+        # errors and rate limits with exponential backoff.
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({'POST'})
+            )
+        ))
+
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        """Release the async client alongside the sync transports"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _build_payload(self, system_prompt, user_prompt, temperature=None, max_tokens=None):
+        """Chat-completion request body shared by the sync and async paths"""
+        if system_prompt is Config.SYSTEM_PROMPT:
+            # The audit system message never changes - reuse it
+            messages = self._base_messages + [{'role': 'user', 'content': user_prompt}]
+        elif system_prompt:
+            messages = [{'role': 'system', 'content': system_prompt},
+                        {'role': 'user', 'content': user_prompt}]
+        else:
+            messages = [{'role': 'user', 'content': user_prompt}]
+
+        data = dict(self._base_payload)
+        data['messages'] = messages
+        if temperature is not None:
+            data['temperature'] = temperature
+        if max_tokens is not None:
+            data['max_tokens'] = max_tokens
+        return data
+
+    @staticmethod
+    def _extract_json(content):
+        """Pull the JSON object out of the response (the model sometimes
+        wraps it in markdown fences or prose) and parse it"""
+        match = _FENCED_JSON_RE.search(content)
+        if match:
+            return _json_loads(match.group(1))
+        match = _BARE_JSON_RE.search(content)
+        if not match:
+            raise json.JSONDecodeError("No JSON object found in response", content, 0)
+        return _json_loads(match.group(0))
+
+    def _get_client(self):
+        """Shared httpx client, created once (double-checked lock)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        http2=_HTTP2_AVAILABLE,
+                        timeout=120.0,
+                        limits=httpx.Limits(max_keepalive_connections=8,
+                                            max_connections=16)
+                    )
+        return self._client
+
+    def _post_json(self, data, headers, timeout=120):
+        """
+        POST a payload to the DeepSeek endpoint.
 
-    def analyze_sow(self, document_text, project_timeline, tables=None):
+        Prefers a shared httpx client (HTTP/2 when the h2 extra is
+        installed) so the analysis + summary calls fired in parallel
+        multiplex over one TLS connection; falls back to one-shot
+        requests.post when httpx is absent.
+        """
+        # Optional body compression - the prompt-heavy bodies are highly
+        # repetitive English and shrink ~4-5x, which matters on slow
+        # uplinks. Opt-in until the gateway's support is confirmed.
+        if Config.DEEPSEEK_ACCEPT_GZIP_BODY:
+            raw = orjson.dumps(data) if _ORJSON_AVAILABLE else json.dumps(data).encode('utf-8')
+            body = gzip.compress(raw, compresslevel=5)
+            gz_headers = {**headers, 'Content-Encoding': 'gzip'}
+            if HTTPX_AVAILABLE:
+                return self._get_client().post(self.api_url, headers=gz_headers,
+                                               content=body, timeout=timeout)
+            return self.session.post(self.api_url, headers=gz_headers,
+                                     data=body, timeout=timeout)
+
+        if HTTPX_AVAILABLE:
+            client = self._get_client()
+            if _ORJSON_AVAILABLE:
+                return client.post(self.api_url, headers=headers,
+                                   content=orjson.dumps(data), timeout=timeout)
+            return client.post(self.api_url, headers=headers, json=data, timeout=timeout)
+        if _ORJSON_AVAILABLE:
+            return self.session.post(self.api_url, headers=headers,
+                                     data=orjson.dumps(data), timeout=timeout)
+        return self.session.post(self.api_url, headers=headers, json=data, timeout=timeout)
+
+    def analyze_sow(self, document_text, project_timeline, tables=None, on_chunk=None):
         """
         Analyze SOW document against 9 mandatory pillars
 
@@ -27,17 +242,41 @@ class LLMAnalyzer:
             document_text: Extracted text from SOW
             project_timeline: Dict with build/test/cutover dates
             tables: Extracted tables (for cost breakdown analysis)
+            on_chunk: Optional callback receiving response text as it streams
 
         Returns:
             Dict with executive_summary, go_no_go, pillars, critical_risks, actionable_redlines
         """
+        if Config.FUSE_LLM_CALLS:
+            # One fused call covers analysis + summary; the summary half
+            # is cached for generate_sow_content_summary (no streaming
+            # on this path - the envelope parse needs the full body)
+            analysis, _ = self._fused(document_text, project_timeline, tables)
+            return analysis
+
         system_prompt = Config.SYSTEM_PROMPT
         user_prompt = self._build_user_prompt(document_text, project_timeline, tables)
 
         try:
-            response = self._call_deepseek_api(system_prompt, user_prompt)
+            response = self._call_deepseek_api(system_prompt, user_prompt, on_chunk=on_chunk,
+                                               response_format=_PILLAR_RESPONSE_FORMAT)
             analysis = self._parse_response(response)
 
+            # The single batched call covers all 9 pillars in one round
+            # trip; the price is that the model can occasionally drop one,
+            # so an incomplete response gets exactly one corrective retry
+            missing = self._missing_pillars(analysis)
+            if missing:
+                retry_prompt = (
+                    user_prompt +
+                    f"\n\nIMPORTANT: Your previous response omitted these mandatory "
+                    f"pillars: {', '.join(missing)}. Return the complete JSON again "
+                    f"with ALL 9 pillars included."
+                )
+                response = self._call_deepseek_api(system_prompt, retry_prompt, on_chunk=on_chunk,
+                                                   response_format=_PILLAR_RESPONSE_FORMAT)
+                analysis = self._parse_response(response)
+
             # Add metadata
             analysis['analysis_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')
             analysis['ai_model'] = self.model
@@ -47,13 +286,14 @@ class LLMAnalyzer:
         except Exception as e:
             raise Exception(f"LLM Analysis failed: {str(e)}")
 
-    def generate_sow_content_summary(self, document_text, tables=None):
+    def generate_sow_content_summary(self, document_text, tables=None, on_chunk=None):
         """
         NEW FEATURE: Generate structured SOW content summary
 
         Args:
             document_text: Full SOW document text
             tables: Extracted tables from document
+            on_chunk: Optional callback receiving response text as it streams
 
         Returns:
             Dict with structured summary including:
@@ -66,6 +306,130 @@ class LLMAnalyzer:
             - parties_involved (vendor/client info)
             - special_terms (notable terms/conditions)
         """
+        if Config.FUSE_LLM_CALLS:
+            # If analyze_sow already ran the fused call for this document,
+            # the summary half is sitting in the cache - no second call
+            with self._fused_lock:
+                cached = self._fused_last
+            if cached is not None and cached[0] == hash(document_text):
+                return cached[2]
+
+        system_prompt, user_prompt = self._build_summary_prompts(document_text, tables)
+
+        try:
+            # temperature 0.3 for focused, consistent summaries; streams
+            # deltas to on_chunk when provided, like analyze_sow. Output
+            # budget scales with document size - decode latency is roughly
+            # linear in generated tokens, so not paying for a fixed 3000
+            # is the cheapest speedup available here
+            max_tokens = self._estimate_summary_tokens(len(document_text))
+            result = self._call_deepseek_api(system_prompt, user_prompt,
+                                             on_chunk=on_chunk,
+                                             temperature=0.3, max_tokens=max_tokens,
+                                             response_format={'type': 'json_object'})
+
+            # A 'length' finish means the JSON was cut off - one retry
+            # with extra headroom rather than failing on a parse error
+            if result['choices'][0].get('finish_reason') == 'length':
+                result = self._call_deepseek_api(system_prompt, user_prompt,
+                                                 on_chunk=on_chunk,
+                                                 temperature=0.3,
+                                                 max_tokens=max_tokens + 512,
+                                                 response_format={'type': 'json_object'})
+
+            summary = self._extract_json(result['choices'][0]['message']['content'])
+
+            # Add metadata
+            summary['generated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')
+            summary['ai_model'] = self.model
+
+            return summary
+
+        except Exception as e:
+            raise Exception(f"SOW Content Summary generation failed: {str(e)}")
+
+    def analyze_and_summarize(self, document_text, project_timeline, tables=None):
+        """
+        Pillar analysis AND content summary in ONE DeepSeek call.
+
+        The two-call path prefills the same document text twice and pays
+        two rounds of TCP/TLS/queue overhead; asking for a single JSON
+        envelope {"analysis": {...}, "summary": {...}} halves the
+        prompt-side cost (decode cost is unchanged).
+
+        Returns:
+            Tuple (analysis, summary) in the same shapes analyze_sow and
+            generate_sow_content_summary return
+        """
+        user_prompt = self._build_fused_prompt(document_text, project_timeline, tables)
+
+        try:
+            # Output budget must cover both halves of the envelope
+            result = self._call_deepseek_api(
+                Config.SYSTEM_PROMPT, user_prompt,
+                max_tokens=self.max_tokens + 3000,
+                response_format={'type': 'json_object'}
+            )
+            envelope = self._extract_json(result['choices'][0]['message']['content'])
+
+            analysis = envelope.get('analysis') or {}
+            summary = envelope.get('summary') or {}
+            if 'pillars' not in analysis:
+                raise ValueError("Fused response missing 'analysis.pillars' field")
+
+            stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')
+            analysis['analysis_date'] = stamp
+            analysis['ai_model'] = self.model
+            summary['generated_at'] = stamp
+            summary['ai_model'] = self.model
+
+            return analysis, summary
+
+        except Exception as e:
+            raise Exception(f"LLM Analysis failed: {str(e)}")
+
+    def _fused(self, document_text, project_timeline, tables):
+        """analyze_and_summarize memoized on the last document - the lock
+        is held across the call so a summary request arriving while the
+        fused call is in flight waits for it instead of duplicating it"""
+        key = hash(document_text)
+        with self._fused_lock:
+            cached = self._fused_last
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2]
+            analysis, summary = self.analyze_and_summarize(
+                document_text, project_timeline, tables)
+            self._fused_last = (key, analysis, summary)
+            return analysis, summary
+
+    def _build_fused_prompt(self, document_text, project_timeline, tables):
+        """User prompt asking for the combined analysis + summary envelope"""
+        analysis_prompt = self._build_user_prompt(document_text, project_timeline, tables)
+        return analysis_prompt + """
+
+ADDITIONALLY generate a structured content summary of the same SOW with these sections:
+- overview: 2-3 paragraphs (project purpose, parties, work performed)
+- key_sections: list of 5-8 "Section Name: Brief description" strings
+- scope_highlights: 4-6 bullet strings of the most important scope items
+- deliverables: list of "Deliverable: Description" strings
+- timeline_overview: paragraph on dates, phases, milestones, duration
+- cost_structure: paragraph on total cost, payment terms, cost breakdown
+- parties_involved: object with vendor_name, client_name, vendor_role, client_role
+- special_terms: 3-5 notable terms or conditions
+- technology_stack: list of technologies/systems mentioned
+- assumptions_constraints: list of key assumptions or constraints
+
+FINAL RESPONSE FORMAT - a single JSON envelope combining both outputs:
+{
+    "analysis": <the analysis JSON in the RESPONSE FORMAT above>,
+    "summary": <the content summary JSON with the sections above>
+}
+
+CRITICAL: Return ONLY this valid JSON envelope. No markdown. No extra text."""
+
+    @staticmethod
+    def _build_summary_prompts(document_text, tables):
+        """System and user prompts for the SOW content summary call"""
         system_prompt = """You are a senior contract analyst specializing in Statement of Work (SOW) documents for IT divestment projects. Your task is to create a comprehensive, well-structured summary of SOW content that executives and stakeholders can quickly understand.
 
 Focus on:
@@ -76,12 +440,12 @@ Focus on:
 - Executive-friendly presentation"""
 
         # Build summary prompt
-        tables_info = f"\n\nEXTRACTED TABLES:\n{json.dumps(tables, indent=2)}" if tables else ""
+        tables_info = f"\n\nEXTRACTED TABLES:\n{_serialize_tables(tables)}" if tables else ""
 
         user_prompt = f"""Analyze this Statement of Work (SOW) document and create a comprehensive content summary.
 
-SOW DOCUMENT TEXT:
-{document_text[:20000]}
+SOW DOCUMENT TEXT (most relevant sections):
+{select_relevant_chunks(document_text, budget_chars=8000)}
 {tables_info}
 
 Generate a structured JSON summary with these sections:
@@ -164,57 +528,26 @@ RESPONSE FORMAT (Valid JSON):
 
 CRITICAL: Return ONLY valid JSON. No markdown. No extra text. Use professional language suitable for executive review."""
 
-        try:
-            # Call Deepseek API
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}'
-            }
-
-            data = {
-                'model': self.model,
-                'messages': [
-                    {'role': 'system', 'content': system_prompt},
-                    {'role': 'user', 'content': user_prompt}
-                ],
-                'temperature': 0.3,  # Focused, consistent summaries
-                'max_tokens': 3000   # Enough for comprehensive summary
-            }
-
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=120
-            )
+        return system_prompt, user_prompt
 
-            if response.status_code != 200:
-                raise Exception(f"API Error {response.status_code}: {response.text}")
-
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
-
-            # Clean markdown code blocks
-            if '```json' in content:
-                start = content.find('```json') + 7
-                end = content.find('```', start)
-                content = content[start:end].strip()
-            elif '```' in content:
-                start = content.find('```') + 3
-                end = content.find('```', start)
-                content = content[start:end].strip()
-
-            # Parse JSON
-            summary = json.loads(content)
-
-            # Add metadata
-            summary['generated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')
-            summary['ai_model'] = self.model
+    @staticmethod
+    def _estimate_summary_tokens(doc_len):
+        """Output-token budget for the content summary, scaled to the
+        document: short SOWs don't need the full 3000-token ceiling"""
+        return min(3000, max(1200, int(800 + doc_len / 50)))
 
-            return summary
+    @staticmethod
+    def _missing_pillars(analysis):
+        """Mandatory pillar names absent from a batched response"""
+        returned = {p.get('name') for p in analysis.get('pillars', [])}
+        return [name for name in Config.PILLARS if name not in returned]
 
-        except Exception as e:
-            raise Exception(f"SOW Content Summary generation failed: {str(e)}")
+    @staticmethod
+    def _format_timeline_date(value):
+        """Format a timeline entry for the prompt - accepts date objects or strings"""
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value if value else 'N/A'
 
     def _build_user_prompt(self, document_text, project_timeline, tables):
         """Build detailed user prompt with SOW content"""
@@ -225,12 +558,12 @@ CRITICAL: Return ONLY valid JSON. No markdown. No extra text. Use professional l
 
 PROJECT TIMELINE (Hard Deadlines):
 - Project: {project_timeline.get('project_name', 'N/A')}
-- Build Phase End: {project_timeline.get('build_end_date', 'N/A')}
-- Test Phase End: {project_timeline.get('test_end_date', 'N/A')}
-- Cutover Phase End: {project_timeline.get('cutover_end_date', 'N/A')}
+- Build Phase End: {self._format_timeline_date(project_timeline.get('build_end_date'))}
+- Test Phase End: {self._format_timeline_date(project_timeline.get('test_end_date'))}
+- Cutover Phase End: {self._format_timeline_date(project_timeline.get('cutover_end_date'))}
 
-SOW DOCUMENT TEXT (First 15,000 chars):
-{document_text[:15000]}
+SOW DOCUMENT TEXT (most pillar-relevant sections):
+{select_relevant_chunks(document_text, budget_chars=6000)}
 {tables_info}
 
 ANALYZE AGAINST 9 MANDATORY PILLARS:
@@ -276,19 +609,28 @@ ANALYZE AGAINST 9 MANDATORY PILLARS:
    - If extraction scope: Data Verification step exists
    - Data quality checks before cutover
    - Carve-out process defined
+"""
 
+        if Config.DEEPSEEK_JSON_SCHEMA:
+            # The schema enforces the shape, so the verbose worked example
+            # (and the whitespace the model mirrors back from it) is
+            # replaced with a terse field list
+            prompt += """
+Return a JSON object with: executive_summary (3-sentence overview), go_no_go ("Go" or "No-Go"), pillars (all 9, each with name, status, risk_level, evidence, recommendation), critical_risks (list of strings), actionable_redlines (list of strings)."""
+        else:
+            prompt += """
 RESPONSE FORMAT (Valid JSON):
-{{
+{
     "executive_summary": "3-sentence overview of SOW quality and findings",
     "go_no_go": "Go" or "No-Go",
     "pillars": [
-        {{
+        {
             "name": "Pricing Model",
             "status": "Met" | "Partial" | "Not Met",
             "risk_level": "Critical" | "High" | "Medium" | "Low",
             "evidence": "Specific quote or finding from document",
             "recommendation": "Actionable suggestion to protect Shell"
-        }},
+        },
         ... (all 9 pillars)
     ],
     "critical_risks": [
@@ -299,66 +641,103 @@ RESPONSE FORMAT (Valid JSON):
         "Redline 1: Change X to Y because...",
         "Redline 2: Add clause Z to protect..."
     ]
-}}
+}
 
 CRITICAL: Return ONLY valid JSON. No markdown. No extra text."""
 
         return prompt
 
-    def _call_deepseek_api(self, system_prompt, user_prompt):
-        """Call Deepseek API"""
+    def _call_deepseek_api(self, system_prompt, user_prompt, on_chunk=None,
+                           temperature=None, max_tokens=None, timeout=120,
+                           response_format=None):
+        """
+        Call Deepseek API
+
+        When on_chunk is provided the request is made with stream=True and
+        each content delta is forwarded to the callback as it arrives,
+        overlapping network/generation time with caller-side rendering.
+        The return value has the same shape either way.
+        """
 
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}'
         }
 
-        data = {
-            'model': self.model,
-            'messages': [
-                {'role': 'system', 'content': system_prompt},
-                {'role': 'user', 'content': user_prompt}
-            ],
-            'temperature': self.temperature,
-            'max_tokens': self.max_tokens
-        }
+        data = self._build_payload(system_prompt, user_prompt,
+                                   temperature=temperature, max_tokens=max_tokens)
+        if response_format is not None:
+            data['response_format'] = response_format
 
         try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=120
-            )
+            if on_chunk is not None:
+                data['stream'] = True
+                response = self.session.post(
+                    self.api_url,
+                    headers=headers,
+                    data=orjson.dumps(data) if _ORJSON_AVAILABLE else json.dumps(data),
+                    timeout=timeout,
+                    stream=True
+                )
+
+                if response.status_code != 200:
+                    raise Exception(f"API Error {response.status_code}: {response.text}")
+
+                content, finish_reason = self._consume_stream(response, on_chunk)
+                return {'choices': [{'message': {'content': content},
+                                     'finish_reason': finish_reason}]}
+
+            response = self._post_json(data, headers, timeout=120)
 
             if response.status_code != 200:
                 raise Exception(f"API Error {response.status_code}: {response.text}")
 
             return response.json()
 
-        except requests.exceptions.Timeout:
+        except _TIMEOUT_ERRORS:
             raise Exception("API request timed out (120s)")
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             raise Exception(f"API request failed: {str(e)}")
 
+    @staticmethod
+    def _consume_stream(response, on_chunk):
+        """Accumulate an SSE token stream, forwarding each delta to on_chunk
+
+        Returns:
+            Tuple (content, finish_reason) - finish_reason is None unless
+            the stream reported one (e.g. 'length' on truncation)
+        """
+        parts = []
+        finish_reason = None
+        for line in response.iter_lines():
+            if not line:
+                continue
+            line = line.decode('utf-8')
+            if not line.startswith('data:'):
+                continue
+            payload = line[5:].strip()
+            if payload == '[DONE]':
+                break
+            try:
+                choice = _json_loads(payload)['choices'][0]
+            except (json.JSONDecodeError, KeyError, IndexError):
+                continue
+            finish_reason = choice.get('finish_reason') or finish_reason
+            chunk = choice.get('delta', {}).get('content')
+            if chunk:
+                parts.append(chunk)
+                try:
+                    on_chunk(chunk)
+                except Exception:
+                    pass  # display callback must never kill the analysis
+        return ''.join(parts), finish_reason
+
     def _parse_response(self, response):
         """Parse Deepseek API response"""
 
         try:
             content = response['choices'][0]['message']['content'].strip()
-
-            # Clean markdown code blocks
-            if '```json' in content:
-                start = content.find('```json') + 7
-                end = content.find('```', start)
-                content = content[start:end].strip()
-            elif '```' in content:
-                start = content.find('```') + 3
-                end = content.find('```', start)
-                content = content[start:end].strip()
-
-            # Parse JSON
-            analysis = json.loads(content)
+            analysis = self._extract_json(content)
 
             # Validate structure
             if 'pillars' not in analysis:
@@ -379,6 +758,9 @@ CRITICAL: Return ONLY valid JSON. No markdown. No extra text."""
         """
         Get specific redline suggestions for a problematic clause
 
+        Thin wrapper over get_redline_suggestions_batch - kept so existing
+        single-clause callers keep working.
+
         Args:
             pillar_name: Which pillar the clause relates to
             current_text: The problematic clause text
@@ -386,7 +768,93 @@ CRITICAL: Return ONLY valid JSON. No markdown. No extra text."""
         Returns:
             Dict with redline suggestions
         """
-        prompt = f"""As a Shell IT contracts expert, provide redline suggestions for this clause:
+        results = self.get_redline_suggestions_batch(
+            [{'pillar': pillar_name, 'current_text': current_text}]
+        )
+        return results.get(pillar_name, {'suggestions': []})
+
+    def get_redline_suggestions_batch(self, pillar_failures):
+        """
+        Redline suggestions for every failing pillar in ONE API call.
+
+        Per-pillar calls pay N round trips of network latency, queue
+        delay and prompt prefill; batching all problematic clauses into
+        a single prompt pays those costs once.
+
+        Args:
+            pillar_failures: List of dicts with 'pillar' and 'current_text'
+
+        Returns:
+            Dict mapping pillar name -> {'suggestions': [...]}
+        """
+        if not pillar_failures:
+            return {}
+
+        prompt = self._build_redline_batch_prompt(pillar_failures)
+
+        # Output budget scales with clause count but stays within the
+        # configured model limit
+        max_tokens = min(1000 * len(pillar_failures), self.max_tokens)
+        data = self._build_payload(None, prompt, temperature=0.2,
+                                   max_tokens=max_tokens)
+
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}'
+        }
+
+        try:
+            response = self._post_json(data, headers, timeout=120)
+
+            result = response.json()
+            parsed = self._extract_json(result['choices'][0]['message']['content'])
+            return {
+                entry.get('pillar'): {'suggestions': entry.get('suggestions', [])}
+                for entry in parsed.get('results', [])
+            }
+
+        except Exception as e:
+            return {
+                failure.get('pillar'): {'suggestions': [{'error': str(e)}]}
+                for failure in pillar_failures
+            }
+
+    @staticmethod
+    def _build_redline_batch_prompt(pillar_failures):
+        """User prompt covering every failing clause in one request"""
+        clauses = "\n\n".join(
+            f"PILLAR: {failure.get('pillar')}\n"
+            f"CURRENT TEXT: \"{failure.get('current_text')}\""
+            for failure in pillar_failures
+        )
+        return f"""As a Shell IT contracts expert, provide redline suggestions for each of these problematic clauses:
+
+{clauses}
+
+For EACH pillar above, provide 2-3 specific redline suggestions to protect Shell's interests in this divestment project.
+
+Format as JSON:
+{{
+    "results": [
+        {{
+            "pillar": "pillar name exactly as given",
+            "suggestions": [
+                {{
+                    "original": "text to replace",
+                    "redlined": "improved text",
+                    "reason": "why this protects Shell"
+                }}
+            ]
+        }}
+    ]
+}}
+
+CRITICAL: Return ONLY valid JSON with one results entry per pillar listed above."""
+
+    @staticmethod
+    def _build_redline_prompt(pillar_name, current_text):
+        """User prompt for the per-clause redline call"""
+        return f"""As a Shell IT contracts expert, provide redline suggestions for this clause:
 
 PILLAR: {pillar_name}
 CURRENT TEXT: "{current_text}"
@@ -404,36 +872,177 @@ Format as JSON:
     ]
 }}"""
 
+    async def _apost_json(self, data, timeout=120):
+        """Async POST over one shared httpx.AsyncClient - concurrent calls
+        multiplex keep-alive (HTTP/2 when available) connections"""
+        if self._aclient is None:
+            with self._client_lock:
+                if self._aclient is None:
+                    self._aclient = httpx.AsyncClient(
+                        http2=_HTTP2_AVAILABLE,
+                        timeout=timeout,
+                        limits=httpx.Limits(max_keepalive_connections=16,
+                                            max_connections=32)
+                    )
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}'
         }
+        if _ORJSON_AVAILABLE:
+            return await self._aclient.post(self.api_url, headers=headers,
+                                            content=orjson.dumps(data), timeout=timeout)
+        return await self._aclient.post(self.api_url, headers=headers,
+                                        json=data, timeout=timeout)
+
+    async def _acall_deepseek_api(self, system_prompt, user_prompt,
+                                  temperature=None, max_tokens=None, timeout=120,
+                                  response_format=None):
+        """Async counterpart of _call_deepseek_api (no streaming)"""
+        data = self._build_payload(system_prompt, user_prompt,
+                                   temperature=temperature, max_tokens=max_tokens)
+        if response_format is not None:
+            data['response_format'] = response_format
+        try:
+            response = await self._apost_json(data, timeout=timeout)
+        except _TIMEOUT_ERRORS:
+            raise Exception(f"API request timed out ({timeout}s)")
+        except _REQUEST_ERRORS as e:
+            raise Exception(f"API request failed: {str(e)}")
 
-        data = {
-            'model': self.model,
-            'messages': [{'role': 'user', 'content': prompt}],
-            'temperature': 0.2,
-            'max_tokens': 1000
-        }
+        if response.status_code != 200:
+            raise Exception(f"API Error {response.status_code}: {response.text}")
 
+        return response.json()
+
+    async def aanalyze_sow(self, document_text, project_timeline, tables=None):
+        """
+        Async variant of analyze_sow.
+
+        The pillar analysis and content summary are independent 10-60s
+        LLM calls; awaiting them together via asyncio.gather turns
+        sum-of-latencies into max-of-latencies. Falls back to the sync
+        path on a worker thread when httpx is not installed.
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.analyze_sow, document_text,
+                                           project_timeline, tables)
+
+        user_prompt = self._build_user_prompt(document_text, project_timeline, tables)
         try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=60
-            )
+            response = await self._acall_deepseek_api(
+                Config.SYSTEM_PROMPT, user_prompt,
+                response_format=_PILLAR_RESPONSE_FORMAT)
+            analysis = self._parse_response(response)
 
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
+            missing = self._missing_pillars(analysis)
+            if missing:
+                retry_prompt = (
+                    user_prompt +
+                    f"\n\nIMPORTANT: Your previous response omitted these mandatory "
+                    f"pillars: {', '.join(missing)}. Return the complete JSON again "
+                    f"with ALL 9 pillars included."
+                )
+                response = await self._acall_deepseek_api(
+                    Config.SYSTEM_PROMPT, retry_prompt,
+                    response_format=_PILLAR_RESPONSE_FORMAT)
+                analysis = self._parse_response(response)
 
-            # Clean markdown
-            if '```json' in content:
-                start = content.find('```json') + 7
-                end = content.find('```', start)
-                content = content[start:end].strip()
+            analysis['analysis_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')
+            analysis['ai_model'] = self.model
+            return analysis
+        except Exception as e:
+            raise Exception(f"LLM Analysis failed: {str(e)}")
+
+    async def analyze_many(self, jobs, max_concurrency=8, rpm=60):
+        """
+        Analyze a batch of SOWs concurrently under a rate limit.
+
+        A sequential loop over aanalyze_sow pays each call's full latency
+        back to back; scheduling up to max_concurrency in-flight requests
+        overlaps them for near-linear speedup up to the provider's
+        concurrency cap. Request starts are also spaced to stay under
+        rpm so a large folder of SOWs doesn't trip DeepSeek's limiter.
+
+        Args:
+            jobs: List of dicts with 'document_text', 'project_timeline'
+                  and optional 'tables'
+            max_concurrency: Maximum simultaneous in-flight requests
+            rpm: Maximum request starts per minute across the batch
+
+        Returns:
+            List aligned with jobs - each entry is the analysis dict, or
+            the Exception for jobs that failed after the retry pass
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        interval = 60.0 / rpm
+        next_slot = 0.0
+        slot_lock = asyncio.Lock()
+
+        async def _throttle():
+            # Token-bucket start spacing: each request claims the next
+            # free slot and sleeps until it arrives
+            nonlocal next_slot
+            async with slot_lock:
+                now = asyncio.get_running_loop().time()
+                wait = next_slot - now
+                next_slot = max(now, next_slot) + interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        async def _run(job):
+            async with sem:
+                await _throttle()
+                return await self.aanalyze_sow(job['document_text'],
+                                               job['project_timeline'],
+                                               job.get('tables'))
+
+        # return_exceptions keeps one bad SOW from sinking the batch
+        results = list(await asyncio.gather(*(_run(job) for job in jobs),
+                                            return_exceptions=True))
+
+        # Retry pass for rate-limit rejections with jittered exponential
+        # backoff - other failures (parse errors, bad documents) are
+        # returned as-is for the caller to surface
+        for attempt in range(1, 3):
+            pending = [i for i, r in enumerate(results)
+                       if isinstance(r, Exception) and '429' in str(r)]
+            if not pending:
+                break
+            await asyncio.sleep(min(30.0, random.uniform(1.0, 2.0 ** attempt * 2)))
+            retried = await asyncio.gather(*(_run(jobs[i]) for i in pending),
+                                           return_exceptions=True)
+            for i, r in zip(pending, retried):
+                results[i] = r
+
+        return results
+
+    async def agenerate_sow_content_summary(self, document_text, tables=None):
+        """Async variant of generate_sow_content_summary"""
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.generate_sow_content_summary,
+                                           document_text, tables)
+
+        system_prompt, user_prompt = self._build_summary_prompts(document_text, tables)
+        try:
+            result = await self._acall_deepseek_api(system_prompt, user_prompt,
+                                                    temperature=0.3, max_tokens=3000)
+            summary = self._extract_json(result['choices'][0]['message']['content'])
+            summary['generated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')
+            summary['ai_model'] = self.model
+            return summary
+        except Exception as e:
+            raise Exception(f"SOW Content Summary generation failed: {str(e)}")
 
-            return json.loads(content)
+    async def aget_redline_suggestions(self, pillar_name, current_text):
+        """Async variant of get_redline_suggestions"""
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.get_redline_suggestions,
+                                           pillar_name, current_text)
 
+        prompt = self._build_redline_prompt(pillar_name, current_text)
+        try:
+            result = await self._acall_deepseek_api(None, prompt, temperature=0.2,
+                                                    max_tokens=1000, timeout=60)
+            return self._extract_json(result['choices'][0]['message']['content'])
         except Exception as e:
             return {'suggestions': [{'error': str(e)}]}
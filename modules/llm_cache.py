@@ -0,0 +1,198 @@
+"""
+LLM Response Cache Module
+Persistent disk-backed cache for Deepseek responses keyed by content hash
+
+Repeated audits of an identical SOW (e.g. after a parameter tweak) return
+the cached analysis in sub-millisecond time instead of re-paying the full
+Deepseek token cost.
+"""
+
+import hashlib
+import json
+import os
+import re
+from config import Config
+
+try:
+    from diskcache import Cache
+    _DISKCACHE_AVAILABLE = True
+except ImportError:
+    _DISKCACHE_AVAILABLE = False
+    print("⚠️ diskcache not installed - LLM cache will not persist across runs")
+
+# sentence-transformers drags in the whole torch stack (seconds of import
+# time), so it is probed lazily on first semantic lookup - the exact-hash
+# cache path never pays for it
+_EMBEDDINGS_STATE = None  # None = not probed, True/False once probed
+
+
+def _embeddings_available():
+    """Import the embedding stack on first use; remember the outcome"""
+    global _EMBEDDINGS_STATE
+    if _EMBEDDINGS_STATE is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            import numpy as np
+            globals()['SentenceTransformer'] = SentenceTransformer
+            globals()['np'] = np
+            _EMBEDDINGS_STATE = True
+        except ImportError:
+            _EMBEDDINGS_STATE = False
+    return _EMBEDDINGS_STATE
+
+
+class LLMCache:
+    """Content-hash cache for LLM analysis results"""
+
+    # Default time-to-live: 24 hours
+    DEFAULT_EXPIRE = 86400
+
+    def __init__(self, cache_dir=None):
+        if _DISKCACHE_AVAILABLE:
+            self._cache = Cache(str(cache_dir or Config.CACHE_DIR))
+        else:
+            # In-process fallback (no persistence, still dedupes within a session)
+            self._cache = {}
+
+    @staticmethod
+    def make_key(document_text, project_timeline=None, prompt_tag='analyze_sow_v2'):
+        """
+        Compute SHA-256 content key over document text + timeline + prompt tag
+
+        Args:
+            document_text: Full extracted SOW text
+            project_timeline: Dict with build/test/cutover dates (or None)
+            prompt_tag: Versioned tag identifying which prompt produced the result
+
+        Returns:
+            str: Hex digest cache key
+        """
+        timeline_json = json.dumps(project_timeline or {}, sort_keys=True, default=str)
+        payload = (document_text + timeline_json + prompt_tag).encode('utf-8', errors='replace')
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key):
+        """Return cached result or None"""
+        try:
+            if _DISKCACHE_AVAILABLE:
+                return self._cache.get(key)
+            return self._cache.get(key)
+        except Exception as e:
+            print(f"⚠️ LLM cache read failed: {str(e)}")
+            return None
+
+    def set(self, key, value, expire=DEFAULT_EXPIRE):
+        """Store result under key with expiry (seconds)"""
+        try:
+            if _DISKCACHE_AVAILABLE:
+                self._cache.set(key, value, expire=expire)
+            else:
+                self._cache[key] = value
+        except Exception as e:
+            print(f"⚠️ LLM cache write failed: {str(e)}")
+
+
+class SemanticLLMCache(LLMCache):
+    """
+    Semantic cache layer - catches near-duplicate SOWs that the exact
+    content-hash cache misses (vendors reuse standard clause language)
+
+    When sentence-transformers is installed, document embeddings are stored
+    in a flat index under cache/semantic/ and a lookup returns the cached
+    analysis if cosine similarity >= Config.SEMANTIC_CACHE_THRESHOLD.
+    Without it, falls back to whitespace/case-normalized hashing, which
+    still catches reformatted copies of the same SOW.
+    """
+
+    EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+    # Chars of normalized text used for the key and the embedding - SOWs
+    # differ in their opening sections (parties, scope, pricing), so the
+    # head is plenty of signal and keeps embedding time flat for huge docs
+    CANON_LIMIT = 8000
+
+    def __init__(self, cache_dir=None):
+        super().__init__(cache_dir)
+        self._semantic_dir = str((cache_dir or Config.CACHE_DIR) / 'semantic') \
+            if not isinstance(cache_dir, str) else os.path.join(cache_dir, 'semantic')
+        self._model = None
+        self._index_path = os.path.join(self._semantic_dir, 'index.npz')
+
+    @staticmethod
+    def normalize_text(text):
+        """Collapse whitespace and case so trivially-reformatted SOWs hash equal"""
+        return re.sub(r'\s+', ' ', text).strip().lower()
+
+    @classmethod
+    def _canonical(cls, text):
+        """Normalized, truncated form used for both the exact key and the
+        embedding query"""
+        return cls.normalize_text(text)[:cls.CANON_LIMIT]
+
+    def _get_model(self):
+        """Lazy-load the embedding model (80 MB, CPU-fast) on first use"""
+        if self._model is None:
+            self._model = SentenceTransformer(self.EMBEDDING_MODEL)
+        return self._model
+
+    def _load_index(self):
+        """Load (vectors, keys) from disk, or empty index"""
+        if os.path.exists(self._index_path):
+            data = np.load(self._index_path, allow_pickle=True)
+            return data['vectors'], list(data['keys'])
+        return None, []
+
+    def get_semantic(self, document_text, prompt_tag='analyze_sow_v2'):
+        """
+        Look up a near-duplicate match for document_text
+
+        Returns:
+            Cached result or None
+        """
+        # Fast path: normalized exact match (works without embeddings)
+        canon = self._canonical(document_text)
+        norm_key = self.make_key(canon, None, prompt_tag)
+        cached = self.get(norm_key)
+        if cached is not None:
+            return cached
+
+        if not _embeddings_available():
+            return None
+
+        try:
+            vectors, keys = self._load_index()
+            if vectors is None or len(keys) == 0:
+                return None
+
+            query = self._get_model().encode([canon], normalize_embeddings=True)[0]
+            scores = vectors @ query
+            best = int(scores.argmax())
+            if scores[best] >= Config.SEMANTIC_CACHE_THRESHOLD:
+                return self.get(f"{keys[best]}:{prompt_tag}")
+            return None
+        except Exception as e:
+            print(f"⚠️ Semantic cache lookup failed: {str(e)}")
+            return None
+
+    def set_semantic(self, document_text, value, prompt_tag='analyze_sow_v2', expire=LLMCache.DEFAULT_EXPIRE):
+        """Store result under both the normalized key and the embedding index"""
+        canon = self._canonical(document_text)
+        norm_key = self.make_key(canon, None, prompt_tag)
+        self.set(norm_key, value, expire=expire)
+
+        if not _embeddings_available():
+            return
+
+        try:
+            os.makedirs(self._semantic_dir, exist_ok=True)
+            doc_key = hashlib.sha256(canon.encode('utf-8', errors='replace')).hexdigest()
+            self.set(f"{doc_key}:{prompt_tag}", value, expire=expire)
+
+            vector = self._get_model().encode([canon], normalize_embeddings=True)
+            vectors, keys = self._load_index()
+            if doc_key not in keys:
+                vectors = vector if vectors is None else np.vstack([vectors, vector])
+                keys.append(doc_key)
+                np.savez(self._index_path, vectors=vectors, keys=np.array(keys))
+        except Exception as e:
+            print(f"⚠️ Semantic cache write failed: {str(e)}")
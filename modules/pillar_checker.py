@@ -3,15 +3,99 @@ Pillar Checker Module
 Validates SOW analysis against 9 Mandatory Divestment Pillars
 """
 
+import re
+from collections import Counter
+
 from config import Config
 from datetime import datetime
 
+# Keyword scans precompiled once - one C-level pass over the evidence
+# string per pattern, instead of a Python substring search per keyword
+_FIXED_COST_RE = re.compile(r'fixed cost|fixed price|lump sum|firm fixed', re.I)
+_TM_RE = re.compile(r'time and material|t&m|hourly rate|daily rate', re.I)
+_PHASE_RE = re.compile(r'\b(build|test|cutover)\b', re.I)
+
+_REQUIRED_PHASES = frozenset({'build', 'test', 'cutover'})
+
+_PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2}
+
+
+class PillarView:
+    """
+    Everything the report renderers derive from the pillar list, computed
+    in ONE walk: the score, summary, critical-failure, recommendation and
+    table methods each used to traverse analysis['pillars'] separately,
+    repeating the same dict lookups per section of the report.
+    """
+
+    def __init__(self, pillars, escalation_check):
+        self.total = len(pillars)
+        self.status_counts = Counter()
+        self.risk_counts = Counter()
+        self.by_name = {}
+        self.critical = []
+        self.recommendations = []
+        self.table_rows = []
+
+        for pillar in pillars:
+            name = pillar.get('name', 'Unknown')
+            status = pillar.get('status')
+            risk = pillar.get('risk_level')
+
+            self.status_counts[status] += 1
+            self.risk_counts[risk] += 1
+            self.by_name[name] = pillar
+
+            is_escalation = escalation_check(pillar)
+
+            if status == 'Not Met' or risk in ['Critical', 'High']:
+                self.critical.append({
+                    'pillar': name,
+                    'status': status or 'Unknown',
+                    'risk': risk or 'Unknown',
+                    'evidence': pillar.get('evidence', 'No evidence provided'),
+                    'recommendation': pillar.get('recommendation', 'Immediate escalation required'),
+                    'requires_planner_task': is_escalation
+                })
+
+            if status in ['Not Met', 'Partial']:
+                priority = 'CRITICAL' if risk == 'Critical' else \
+                           'HIGH' if risk == 'High' else \
+                           'MEDIUM'
+                self.recommendations.append({
+                    'pillar': name,
+                    'status': status or 'Unknown',
+                    'risk': risk or 'Unknown',
+                    'evidence': pillar.get('evidence', 'No evidence'),
+                    'recommendation': pillar.get('recommendation', 'Review compliance gap'),
+                    'priority': priority,
+                    'requires_escalation': is_escalation
+                })
+
+            evidence_text = pillar.get('evidence', 'Not found')
+            if len(evidence_text) > 150:
+                evidence_text = evidence_text[:150] + '...'
+            self.table_rows.append({
+                'Pillar': name,
+                'Status': status or 'Unknown',
+                'Risk Level': risk or 'Unknown',
+                'Evidence': evidence_text,
+                'Recommendation': pillar.get('recommendation', 'N/A')
+            })
+
+        # Sorted once, shared by every consumer
+        self.recommendations.sort(key=lambda x: _PRIORITY_ORDER.get(x['priority'], 3))
+
+
 class PillarChecker:
     """Validates and scores SOW compliance against 9 mandatory pillars"""
 
     def __init__(self):
         self.pillars = Config.PILLARS
         self.pillar_descriptions = Config.PILLAR_DESCRIPTIONS
+        # O(1) membership checks during validation (the list stays around
+        # for callers that rely on pillar ordering)
+        self._pillar_set = frozenset(Config.PILLARS)
 
     def validate_analysis(self, analysis):
         """
@@ -27,23 +111,96 @@ class PillarChecker:
         if not analysis or 'pillars' not in analysis:
             return False, "Invalid analysis structure: missing 'pillars' field"
 
+        # Validation runs when pillars may have been (re)assigned - drop
+        # any stale derived view so later lookups rebuild it
+        analysis.pop('_view', None)
+
         validated_pillars = []
         for pillar in analysis['pillars']:
             if 'name' not in pillar:
                 return False, "Pillar missing 'name' field"
 
-            if pillar['name'] not in self.pillars:
+            if pillar['name'] not in self._pillar_set:
                 return False, f"Invalid pillar: '{pillar['name']}' (not in mandatory 9 pillars)"
 
             validated_pillars.append(pillar['name'])
 
         # Check for missing pillars
-        missing = set(self.pillars) - set(validated_pillars)
+        missing = self._pillar_set - set(validated_pillars)
         if missing:
             return False, f"Missing mandatory pillars: {', '.join(missing)}"
 
         return True, "All 9 mandatory pillars validated successfully"
 
+    def full_scorecard(self, analysis):
+        """
+        Fused single-pass scorecard: validation + compliance score +
+        critical-failure scan in one walk over the pillar list
+        (equivalent to calling validate_analysis, calculate_compliance_score
+        and get_critical_failures, with one-third the dict lookups)
+
+        Returns:
+            Tuple (is_valid, message, score, critical_failures)
+        """
+
+        if not analysis or 'pillars' not in analysis:
+            return False, "Invalid analysis structure: missing 'pillars' field", 0, []
+
+        # Same invalidation as validate_analysis - see view()
+        analysis.pop('_view', None)
+
+        seen_pillars = []
+        points = 0.0
+        critical = []
+
+        for pillar in analysis['pillars']:
+            if 'name' not in pillar:
+                return False, "Pillar missing 'name' field", 0, []
+            if pillar['name'] not in self._pillar_set:
+                return False, f"Invalid pillar: '{pillar['name']}' (not in mandatory 9 pillars)", 0, []
+            seen_pillars.append(pillar['name'])
+
+            status = pillar.get('status')
+            if status == 'Met':
+                points += 1.0
+            elif status == 'Partial':
+                points += 0.5
+
+            if status == 'Not Met' or pillar.get('risk_level') in ['Critical', 'High']:
+                critical.append({
+                    'pillar': pillar['name'],
+                    'status': status or 'Unknown',
+                    'risk': pillar.get('risk_level', 'Unknown'),
+                    'evidence': pillar.get('evidence', 'No evidence provided'),
+                    'recommendation': pillar.get('recommendation', 'Immediate escalation required'),
+                    'requires_planner_task': self.should_create_planner_task(pillar)
+                })
+
+        total = len(seen_pillars)
+        score = round((points / total) * 100, 1) if total else 0
+
+        missing = self._pillar_set - set(seen_pillars)
+        if missing:
+            return False, f"Missing mandatory pillars: {', '.join(missing)}", score, critical
+
+        return True, "All 9 mandatory pillars validated successfully", score, critical
+
+    def view(self, analysis):
+        """
+        Memoized PillarView for this analysis - the single-pass walk runs
+        once and every derived accessor below reads from it. Cached on
+        the analysis dict itself so a fresh analysis starts clean.
+        """
+        v = analysis.get('_view')
+        if v is None:
+            v = PillarView(analysis.get('pillars', []), self.should_create_planner_task)
+            analysis['_view'] = v
+        return v
+
+    def _by_name(self, analysis):
+        """Name -> pillar dict index (from the shared view)"""
+        return self.view(analysis).by_name
+
     def calculate_compliance_score(self, analysis):
         """
         Calculate overall compliance score (0-100%)
@@ -54,14 +211,11 @@ class PillarChecker:
         if 'pillars' not in analysis:
             return 0
 
-        total = len(analysis['pillars'])
-        if total == 0:
+        v = self.view(analysis)
+        if v.total == 0:
             return 0
 
-        met = sum(1 for p in analysis['pillars'] if p.get('status') == 'Met')
-        partial = sum(0.5 for p in analysis['pillars'] if p.get('status') == 'Partial')
-
-        score = ((met + partial) / total) * 100
+        score = ((v.status_counts['Met'] + 0.5 * v.status_counts['Partial']) / v.total) * 100
         return round(score, 1)
 
     def get_critical_failures(self, analysis):
@@ -72,26 +226,10 @@ class PillarChecker:
             List of dicts with critical pillar failures
         """
 
-        critical = []
-
         if 'pillars' not in analysis:
-            return critical
-
-        for pillar in analysis['pillars']:
-            # Critical if: Not Met OR High/Critical risk
-            if (pillar.get('status') == 'Not Met' or 
-                pillar.get('risk_level') in ['Critical', 'High']):
-
-                critical.append({
-                    'pillar': pillar['name'],
-                    'status': pillar.get('status', 'Unknown'),
-                    'risk': pillar.get('risk_level', 'Unknown'),
-                    'evidence': pillar.get('evidence', 'No evidence provided'),
-                    'recommendation': pillar.get('recommendation', 'Immediate escalation required'),
-                    'requires_planner_task': self.should_create_planner_task(pillar)
-                })
+            return []
 
-        return critical
+        return self.view(analysis).critical
 
     def should_create_planner_task(self, pillar):
         """
@@ -118,26 +256,19 @@ class PillarChecker:
         if 'pillars' not in analysis:
             return {}
 
-        total = len(analysis['pillars'])
-        met = sum(1 for p in analysis['pillars'] if p.get('status') == 'Met')
-        partial = sum(1 for p in analysis['pillars'] if p.get('status') == 'Partial')
-        not_met = sum(1 for p in analysis['pillars'] if p.get('status') == 'Not Met')
-
-        critical = sum(1 for p in analysis['pillars'] if p.get('risk_level') == 'Critical')
-        high = sum(1 for p in analysis['pillars'] if p.get('risk_level') == 'High')
-        medium = sum(1 for p in analysis['pillars'] if p.get('risk_level') == 'Medium')
-        low = sum(1 for p in analysis['pillars'] if p.get('risk_level') == 'Low')
-
+        # ✨ Counts come from the shared single-pass view
+        v = self.view(analysis)
+        met = v.status_counts['Met']
         return {
-            'total': total,
+            'total': v.total,
             'met': met,
-            'partial': partial,
-            'not_met': not_met,
-            'critical_risk': critical,
-            'high_risk': high,
-            'medium_risk': medium,
-            'low_risk': low,
-            'compliance_rate': round((met / total) * 100, 1) if total > 0 else 0
+            'partial': v.status_counts['Partial'],
+            'not_met': v.status_counts['Not Met'],
+            'critical_risk': v.risk_counts['Critical'],
+            'high_risk': v.risk_counts['High'],
+            'medium_risk': v.risk_counts['Medium'],
+            'low_risk': v.risk_counts['Low'],
+            'compliance_rate': round((met / v.total) * 100, 1) if v.total > 0 else 0
         }
 
     def format_compliance_table(self, analysis):
@@ -151,21 +282,7 @@ class PillarChecker:
         if 'pillars' not in analysis:
             return []
 
-        table_data = []
-        for pillar in analysis['pillars']:
-            evidence_text = pillar.get('evidence', 'Not found')
-            if len(evidence_text) > 150:
-                evidence_text = evidence_text[:150] + '...'
-
-            table_data.append({
-                'Pillar': pillar['name'],
-                'Status': pillar.get('status', 'Unknown'),
-                'Risk Level': pillar.get('risk_level', 'Unknown'),
-                'Evidence': evidence_text,
-                'Recommendation': pillar.get('recommendation', 'N/A')
-            })
-
-        return table_data
+        return self.view(analysis).table_rows
 
     def get_detailed_recommendations(self, analysis):
         """
@@ -175,29 +292,7 @@ class PillarChecker:
             List of dicts sorted by priority
         """
 
-        recommendations = []
-
-        for pillar in analysis.get('pillars', []):
-            if pillar.get('status') in ['Not Met', 'Partial']:
-                priority = 'CRITICAL' if pillar.get('risk_level') == 'Critical' else \
-                          'HIGH' if pillar.get('risk_level') == 'High' else \
-                          'MEDIUM'
-
-                recommendations.append({
-                    'pillar': pillar['name'],
-                    'status': pillar.get('status', 'Unknown'),
-                    'risk': pillar.get('risk_level', 'Unknown'),
-                    'evidence': pillar.get('evidence', 'No evidence'),
-                    'recommendation': pillar.get('recommendation', 'Review compliance gap'),
-                    'priority': priority,
-                    'requires_escalation': self.should_create_planner_task(pillar)
-                })
-
-        # Sort by priority (CRITICAL > HIGH > MEDIUM)
-        priority_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 3))
-
-        return recommendations
+        return self.view(analysis).recommendations
 
     def check_pricing_model_compliance(self, analysis):
         """
@@ -207,11 +302,7 @@ class PillarChecker:
             Dict with detailed pricing compliance info
         """
 
-        pricing_pillar = None
-        for pillar in analysis.get('pillars', []):
-            if pillar['name'] == 'Pricing Model':
-                pricing_pillar = pillar
-                break
+        pricing_pillar = self._by_name(analysis).get('Pricing Model')
 
         if not pricing_pillar:
             return {
@@ -221,15 +312,13 @@ class PillarChecker:
                 'issues': ['Pricing Model pillar not found in analysis']
             }
 
-        evidence_lower = pricing_pillar.get('evidence', '').lower()
+        evidence = pricing_pillar.get('evidence', '')
 
         # Check for Fixed Cost indicators
-        fixed_cost_keywords = ['fixed cost', 'fixed price', 'lump sum', 'firm fixed']
-        is_fixed_cost = any(keyword in evidence_lower for keyword in fixed_cost_keywords)
+        is_fixed_cost = bool(_FIXED_COST_RE.search(evidence))
 
         # Check for Time & Material (critical risk)
-        tm_keywords = ['time and material', 't&m', 'hourly rate', 'daily rate']
-        has_tm_clauses = any(keyword in evidence_lower for keyword in tm_keywords)
+        has_tm_clauses = bool(_TM_RE.search(evidence))
 
         issues = []
         if has_tm_clauses:
@@ -258,11 +347,7 @@ class PillarChecker:
             Dict with schedule compliance info
         """
 
-        schedule_pillar = None
-        for pillar in analysis.get('pillars', []):
-            if pillar['name'] == 'Schedule':
-                schedule_pillar = pillar
-                break
+        schedule_pillar = self._by_name(analysis).get('Schedule')
 
         if not schedule_pillar:
             return {
@@ -272,13 +357,12 @@ class PillarChecker:
             }
 
         issues = []
-        evidence_lower = schedule_pillar.get('evidence', '').lower()
+        evidence = schedule_pillar.get('evidence', '')
 
-        # Check if required phases are mentioned
-        required_phases = ['build', 'test', 'cutover']
-        for phase in required_phases:
-            if phase not in evidence_lower:
-                issues.append(f"{phase.title()} phase not clearly defined in SOW")
+        # Check if required phases are mentioned - one scan finds them all
+        found_phases = {m.group(1).lower() for m in _PHASE_RE.finditer(evidence)}
+        for phase in sorted(_REQUIRED_PHASES - found_phases):
+            issues.append(f"{phase.title()} phase not clearly defined in SOW")
 
         # Check pillar status
         if schedule_pillar.get('status') != 'Met':
@@ -5,161 +5,514 @@ Enhanced PDF Report Generator - COMPREHENSIVE FIX
 ✅ Handles multiple field name variations from LLM
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, black, white, grey
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak, KeepTogether
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from pathlib import PurePath
+import gzip
+import io
 import os
 import json
+import re
+
+# Optional NumPy - only worth dispatching to for bulk-audit pillar lists
+# (see _tally); the app's standard 9-pillar reports stay on the Python path
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+# Optional C-speed JSON for the data-integration report - stdlib json's
+# pure-Python encoder is the bottleneck on large analysis payloads
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Optional binary MessagePack output - same report schema, several-fold
+# smaller artifacts for integration consumers that support it
+try:
+    import ormsgpack
+    _ORMSGPACK_AVAILABLE = True
+except ImportError:
+    _ORMSGPACK_AVAILABLE = False
+
+
+# 1 MiB write buffer for JSON emission - the default 8 KB buffer turns a
+# large report into hundreds of write() syscalls
+_WRITE_BUF = 1 << 20
+
+
+def _open_out(path, binary, compress):
+    """Output file for _dump_json - plain buffered file, or gzip at
+    compresslevel=1 (CPU-cheap, still 5-10x on verbose audit JSON)"""
+    if compress:
+        if binary:
+            return gzip.open(path, 'wb', compresslevel=1)
+        return gzip.open(path, 'wt', compresslevel=1, encoding='utf-8')
+    if binary:
+        return open(path, 'wb', buffering=_WRITE_BUF)
+    return open(path, 'w', encoding='utf-8', buffering=_WRITE_BUF)
+
+
+def _dump_json(obj, path, pretty=False, encoded=None, compress=False):
+    """Write obj to path as JSON - orjson's C encoder when installed
+    (also handles numpy scalars and non-string keys natively), stdlib
+    json otherwise. Compact by default; indentation is opt-in since the
+    output is machine-consumed and pretty-printing roughly doubles
+    encode time and inflates the file.
+
+    encoded optionally maps top-level keys to pre-encoded JSON bytes;
+    the compact orjson path splices those in verbatim instead of
+    re-encoding the value (other paths ignore it).
+
+    Either way the 1 MiB buffer coalesces the emission into a handful of
+    write() syscalls - orjson hands over one bytes object per top-level
+    value, and stdlib json.dump's per-token writes land in the buffer.
+    Numeric-heavy sub-trees (scores, counts) get orjson's C number
+    formatting for free since the whole payload goes through it when
+    installed - no per-key splice layer into the stdlib encoder needed"""
+    if _ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty or not isinstance(obj, dict):
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with _open_out(path, True, compress) as f:
+                f.write(orjson.dumps(obj, option=option))
+            return
+        # Compact dict path: encode one top-level value at a time and
+        # splice the object together, so peak memory is the largest
+        # sub-value (usually 'analysis') rather than the whole document
+        with _open_out(path, True, compress) as f:
+            f.write(b'{')
+            first = True
+            for key, value in obj.items():
+                if not first:
+                    f.write(b',')
+                f.write(orjson.dumps(str(key)))
+                f.write(b':')
+                blob = encoded.get(key) if encoded else None
+                f.write(blob if blob is not None else orjson.dumps(value, option=option))
+                first = False
+            f.write(b'}')
+        return
+    # Stdlib json.dump already streams iterencode chunks to the file
+    with _open_out(path, False, compress) as f:
+        if pretty:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+
+# ReportLab is imported lazily - pulling in the Platypus layout engine
+# costs a few hundred ms of cold start, previously paid by anything that
+# imported this module even without rendering a PDF. _ensure_reportlab()
+# binds the names below as module globals on first ReportGenerator use.
+_RL_LOADED = False
+
+
+def _ensure_reportlab():
+    """Import ReportLab once, on first use"""
+    global _RL_LOADED, letter, A4, getSampleStyleSheet, ParagraphStyle, \
+        TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY, inch, HexColor, black, \
+        white, grey, SimpleDocTemplate, Paragraph, Spacer, Table, \
+        TableStyle, Image, PageBreak, KeepTogether, canvas, colors, \
+        stringWidth, _ROW_COLORS, _PILLAR_BASE_STYLE, _RISK_BASE_STYLE, \
+        _PARTIES_TABLE_STYLE, _COVER_SUMMARY_STYLE, _COVER_HEADER_STYLE, \
+        _SPACER_H, _HDR_OFFSET
+    if _RL_LOADED:
+        return
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
+    from reportlab.lib.units import inch
+    from reportlab.lib.colors import HexColor, black, white, grey
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak, KeepTogether
+    from reportlab.pdfgen import canvas
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.lib import colors
+
+    # Unit constants folded once - CPython re-evaluates 0.15*inch on
+    # every use otherwise (per spacer, per page-header setup)
+    _SPACER_H = 0.15 * inch
+    _HDR_OFFSET = 0.3 * inch
+
+    # Alternating body-row colors shared by the report tables
+    _ROW_COLORS = (HexColor('#f9f9f9'), HexColor('#ffffff'))
+
+    # TableStyle parses and normalizes every command tuple on
+    # construction - the static command sets are built once here and
+    # shared by all reports; only the per-row BACKGROUND spans (which
+    # depend on row count) stay per-call
+    _PILLAR_BASE_STYLE = TableStyle([
+        # Header styling
+        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1f4788')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#FFFFFF')),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('TOPPADDING', (0, 0), (-1, 0), 10),
+
+        # Body row styling (text defaults to black - no TEXTCOLOR needed)
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+
+        # Alignment
+        ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # # column
+        ('ALIGN', (1, 1), (1, -1), 'LEFT'),    # Pillar column
+        ('ALIGN', (2, 1), (3, -1), 'CENTER'),  # Status & Risk columns
+        ('ALIGN', (4, 1), (4, -1), 'LEFT'),    # Key Finding column
+        ('VALIGN', (0, 1), (-1, -1), 'TOP'),   # ✨ TOP alignment for wrapping
+
+        # Padding for readability
+        ('TOPPADDING', (0, 1), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
+        ('LEFTPADDING', (0, 1), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 1), (-1, -1), 8),
+
+        # Grid and borders
+        ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc')),
+        ('LINEABOVE', (0, 0), (-1, 0), 2, HexColor('#1f4788')),
+        ('LINEBELOW', (0, -1), (-1, -1), 2, HexColor('#1f4788'))
+    ])
+
+    _RISK_BASE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1f4788')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc')),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8)
+    ])
+
+    _PARTIES_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), HexColor('#f0f0f0')),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, HexColor('#cccccc'))
+    ])
+
+    _COVER_SUMMARY_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), HexColor('#f0f0f0')),
+        ('BACKGROUND', (1, 0), (1, -1), HexColor('#e8f4f8')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), black),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, black)
+    ])
+
+    _COVER_HEADER_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 0.2*inch),
+        ('BOTTOMPADDING', (0, 1), (-1, 1), 0.4*inch),
+        ('BOTTOMPADDING', (0, 2), (-1, 2), 0.3*inch)
+    ])
+
+    _RL_LOADED = True
+
+
+# Characters stripped when deriving a safe report filename - one C-level
+# regex scan instead of a per-character Python loop
+_SAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9 _-]+')
+
+# Entity escapes for LLM-sourced text headed into Paragraph markup
+_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Constant left half of the per-page header drawn by _make_header_fn
+_HEADER_TEXT = "SOW AUDIT REPORT - CONFIDENTIAL"
+
+# Placeholder for findings with an empty/missing recommendation - one
+# shared string instead of a fresh literal per finding (the Paragraph
+# wrapping it is NOT shared: ReportLab mutates flowables during layout)
+_NO_REC = 'No recommendation provided.'
+
+
+def _escape_if_needed(text):
+    """XML-escape text only when it actually contains markup characters -
+    most LLM output is clean prose, so the common case skips the
+    translate pass entirely (Paragraph's own markup parse still runs)"""
+    if '&' in text or '<' in text or '>' in text:
+        return text.translate(_ESCAPE_TABLE)
+    return text
+
+# Field names probed for a pillar's key finding, in order of preference -
+# the LLM is not fully consistent about which one it uses
+_KEY_FINDING_FIELDS = (
+    'key_finding',
+    'details',
+    'finding',
+    'summary',
+    'description',
+    'evidence',
+    'analysis',
+    'compliance_note',
+    'observation'
+)
+
+# Stylesheet singleton - styles.add clones and validates every style, so
+# rebuilding the ten custom styles per ReportGenerator() is pure waste in
+# a long-running app that generates many reports
+_STYLES = None
+
+# Header row for the pillar summary table, built once alongside the
+# stylesheet - Paragraph flowables are reusable across builds
+_PILLAR_HEADER = None
+
+
+def _build_styles():
+    """Build the shared stylesheet (called once per process)"""
+    styles = getSampleStyleSheet()
+
+    # Main title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=28,
+        textColor=HexColor('#667eea'),
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Section title
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=HexColor('#667eea'),
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Subsection title
+    styles.add(ParagraphStyle(
+        name='SubsectionTitle',
+        parent=styles['Heading3'],
+        fontSize=13,
+        textColor=HexColor('#333333'),
+        spaceAfter=8,
+        spaceBefore=8,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Evidence text
+    styles.add(ParagraphStyle(
+        name='EvidenceText',
+        fontSize=10,
+        textColor=HexColor('#444444'),
+        leftIndent=20,
+        rightIndent=20,
+        spaceAfter=6,
+        alignment=TA_JUSTIFY
+    ))
+
+    # Recommendation text
+    styles.add(ParagraphStyle(
+        name='RecommendationText',
+        fontSize=10,
+        textColor=HexColor('#1e3a5f'),
+        leftIndent=20,
+        rightIndent=20,
+        spaceAfter=6,
+        fontName='Helvetica-Bold',
+        alignment=TA_JUSTIFY,
+        backColor=HexColor('#e3f2fd')
+    ))
+
+    # Custom body text
+    styles.add(ParagraphStyle(
+        name='SOWBodyText',
+        fontSize=10,
+        textColor=HexColor('#333333'),
+        alignment=TA_JUSTIFY,
+        spaceAfter=8,
+        leading=14
+    ))
+
+    # Bullet point style
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        fontSize=10,
+        textColor=HexColor('#333333'),
+        leftIndent=25,
+        spaceAfter=6,
+        leading=14
+    ))
+
+    # Highlighted text (for important info in summary)
+    styles.add(ParagraphStyle(
+        name='HighlightText',
+        fontSize=10,
+        textColor=HexColor('#1f4788'),
+        fontName='Helvetica-Bold',
+        alignment=TA_JUSTIFY,
+        spaceAfter=8,
+        leading=14,
+        backColor=HexColor('#fff9c4')
+    ))
+
+    # ✨ Table cell text with wrapping
+    styles.add(ParagraphStyle(
+        name='TableCellText',
+        fontSize=9,
+        textColor=HexColor('#333333'),
+        alignment=TA_LEFT,
+        spaceAfter=4,
+        leading=12,
+        wordWrap='CJK'
+    ))
+
+    # ✨ Table cell text for labels (bold)
+    styles.add(ParagraphStyle(
+        name='TableCellLabel',
+        fontSize=9,
+        textColor=HexColor('#333333'),
+        fontName='Helvetica-Bold',
+        alignment=TA_LEFT,
+        spaceAfter=4,
+        leading=12
+    ))
+
+    # Table header style
+    styles.add(ParagraphStyle(
+        name='TableHeaderText',
+        fontSize=10,
+        textColor=HexColor('#FFFFFF'),
+        fontName='Helvetica-Bold',
+        alignment=TA_CENTER,
+        spaceAfter=4
+    ))
+
+    return styles
+
+
+def _get_styles():
+    """Shared stylesheet, built on first use"""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = _build_styles()
+    return _STYLES
+
+
+def _pillar_header_row():
+    """Header cells for the pillar summary table, built once"""
+    global _PILLAR_HEADER
+    if _PILLAR_HEADER is None:
+        header_style = _get_styles()['TableHeaderText']
+        _PILLAR_HEADER = (
+            Paragraph("<b>#</b>", header_style),
+            Paragraph("<b>Pillar</b>", header_style),
+            Paragraph("<b>Status</b>", header_style),
+            Paragraph("<b>Risk</b>", header_style),
+            Paragraph("<b>Key Finding</b>", header_style)
+        )
+    return _PILLAR_HEADER
+
+
+def generate_report_bytes(analysis, sow_filename, document_metadata=None, sow_content_summary=None):
+    """
+    Picklable worker: build the PDF entirely in this process and hand the
+    finished bytes back.
+
+    ReportLab layout is pure CPU and holds the GIL for the whole
+    doc.build(), so callers (the Streamlit app) submit this to a process
+    pool to keep their own interpreter responsive. Constructing the
+    ReportGenerator here avoids pickling style sheets across processes.
+
+    Returns:
+        Tuple (suggested_filename, pdf_bytes)
+    """
+    buffer = io.BytesIO()
+    generator = ReportGenerator()
+    filename = generator.generate_report(
+        analysis, sow_filename,
+        document_metadata=document_metadata,
+        sow_content_summary=sow_content_summary,
+        output_buffer=buffer
+    )
+    return filename, buffer.getvalue()
+
+
+def _generate_report_job(job):
+    """Picklable worker for ReportGenerator.generate_batch - builds one
+    report to disk in this process (the lazy ReportLab import and
+    stylesheet singleton initialize per worker on first use)"""
+    generator = ReportGenerator()
+    return generator.generate_report(
+        job['analysis'], job['sow_filename'],
+        document_metadata=job.get('document_metadata'),
+        sow_content_summary=job.get('sow_content_summary')
+    )
+
 
 class ReportGenerator:
     """Generate comprehensive PDF audit reports with proper text wrapping"""
 
     def __init__(self, output_path="audit_report.pdf"):
+        _ensure_reportlab()
         self.output_path = output_path
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
+        # Shared module-level stylesheet - see _build_styles
+        self.styles = _get_styles()
         self.page_width, self.page_height = letter
         self.margin = 0.5 * inch
+        # Average glyph width of the table cell font - one metrics call
+        # instead of per-character probing when sizing truncation budgets
+        self._avg_char_w = stringWidth('abcdefghij', 'Helvetica', 9) / 10
+        # Header coordinates computed once, not once per page
+        self._hdr_y = self.page_height - _HDR_OFFSET
+        self._hdr_right_x = self.page_width - self.margin
+        # Lazy helper thread for background JSON writes - see
+        # generate_json_report / wait_json
+        self._io_pool = None
+        self._json_future = None
+        # (metadata_obj, encoded_bytes) of the last metadata dict - see
+        # _metadata_blob
+        self._meta_memo = None
+
+    @staticmethod
+    def _tally(pillars):
+        """
+        Status and risk counts plus the compliance score in ONE walk over
+        the pillar list - the cover page, executive summary and risk
+        matrix each used to re-scan it with a generator expression per
+        category (ten passes per report).
 
-    def _create_custom_styles(self):
-        """Create custom paragraph styles for the report"""
-
-        # Main title style
-        if 'CustomTitle' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='CustomTitle',
-                parent=self.styles['Heading1'],
-                fontSize=28,
-                textColor=HexColor('#667eea'),
-                spaceAfter=12,
-                alignment=TA_CENTER,
-                fontName='Helvetica-Bold'
-            ))
-
-        # Section title
-        if 'SectionTitle' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SectionTitle',
-                parent=self.styles['Heading2'],
-                fontSize=16,
-                textColor=HexColor('#667eea'),
-                spaceAfter=12,
-                spaceBefore=12,
-                fontName='Helvetica-Bold'
-            ))
-
-        # Subsection title
-        if 'SubsectionTitle' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SubsectionTitle',
-                parent=self.styles['Heading3'],
-                fontSize=13,
-                textColor=HexColor('#333333'),
-                spaceAfter=8,
-                spaceBefore=8,
-                fontName='Helvetica-Bold'
-            ))
-
-        # Evidence text
-        if 'EvidenceText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='EvidenceText',
-                fontSize=10,
-                textColor=HexColor('#444444'),
-                leftIndent=20,
-                rightIndent=20,
-                spaceAfter=6,
-                alignment=TA_JUSTIFY
-            ))
-
-        # Recommendation text
-        if 'RecommendationText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='RecommendationText',
-                fontSize=10,
-                textColor=HexColor('#1e3a5f'),
-                leftIndent=20,
-                rightIndent=20,
-                spaceAfter=6,
-                fontName='Helvetica-Bold',
-                alignment=TA_JUSTIFY,
-                backColor=HexColor('#e3f2fd')
-            ))
-
-        # Custom body text
-        if 'SOWBodyText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SOWBodyText',
-                fontSize=10,
-                textColor=HexColor('#333333'),
-                alignment=TA_JUSTIFY,
-                spaceAfter=8,
-                leading=14
-            ))
-
-        # Bullet point style
-        if 'BulletPoint' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='BulletPoint',
-                fontSize=10,
-                textColor=HexColor('#333333'),
-                leftIndent=25,
-                spaceAfter=6,
-                leading=14
-            ))
-
-        # Highlighted text (for important info in summary)
-        if 'HighlightText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='HighlightText',
-                fontSize=10,
-                textColor=HexColor('#1f4788'),
-                fontName='Helvetica-Bold',
-                alignment=TA_JUSTIFY,
-                spaceAfter=8,
-                leading=14,
-                backColor=HexColor('#fff9c4')
-            ))
-
-        # ✨ Table cell text with wrapping
-        if 'TableCellText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='TableCellText',
-                fontSize=9,
-                textColor=HexColor('#333333'),
-                alignment=TA_LEFT,
-                spaceAfter=4,
-                leading=12,
-                wordWrap='CJK'
-            ))
-
-        # ✨ Table cell text for labels (bold)
-        if 'TableCellLabel' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='TableCellLabel',
-                fontSize=9,
-                textColor=HexColor('#333333'),
-                fontName='Helvetica-Bold',
-                alignment=TA_LEFT,
-                spaceAfter=4,
-                leading=12
-            ))
-
-        # Table header style
-        if 'TableHeaderText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='TableHeaderText',
-                fontSize=10,
-                textColor=HexColor('#FFFFFF'),
-                fontName='Helvetica-Bold',
-                alignment=TA_CENTER,
-                spaceAfter=4
-            ))
+        Returns:
+            Tuple (status_counts, risk_counts, score)
+        """
+        total = len(pillars)
+
+        if _NUMPY_AVAILABLE and total > 32:
+            # Bulk-audit path: count each field in one C-level pass.
+            # Below ~32 rows the array construction and dispatch overhead
+            # outweighs the vectorized counting, so small reports keep
+            # the plain loop.
+            statuses = np.array([pillar.get('status') or '' for pillar in pillars])
+            risks = np.array([pillar.get('risk_level') or pillar.get('risklevel') or ''
+                              for pillar in pillars])
+            status_counts = Counter(
+                {str(k): int(c) for k, c in zip(*np.unique(statuses, return_counts=True))})
+            risk_counts = Counter(
+                {str(k): int(c) for k, c in zip(*np.unique(risks, return_counts=True))})
+        else:
+            status_counts = Counter()
+            risk_counts = Counter()
+            for pillar in pillars:
+                status_counts[pillar.get('status')] += 1
+                risk_counts[pillar.get('risk_level', pillar.get('risklevel'))] += 1
+        score = round((status_counts['Met'] / total) * 100, 1) if total > 0 else 0
+        return status_counts, risk_counts, score
 
     def _extract_key_finding(self, pillar):
         """
@@ -172,23 +525,12 @@ class ReportGenerator:
         Returns:
             str: Key finding text or 'No information provided'
         """
-        # Try multiple field names in order of preference
-        field_names = [
-            'key_finding',
-            'details',
-            'finding',
-            'summary',
-            'description',
-            'evidence',
-            'analysis',
-            'compliance_note',
-            'observation'
-        ]
-
-        for field_name in field_names:
-            value = pillar.get(field_name, '').strip()
-            if value:
-                return value
+        # Probe field names in order of preference - no default-string
+        # allocation on misses, no .strip() on absent values
+        for field_name in _KEY_FINDING_FIELDS:
+            value = pillar.get(field_name)
+            if isinstance(value, str) and (stripped := value.strip()):
+                return stripped
 
         # If no field found, create a summary from available data
         status = pillar.get('status', 'Unknown')
@@ -203,7 +545,7 @@ class ReportGenerator:
         else:
             return "No detailed information provided."
 
-    def generate_report(self, analysis, sow_filename, document_metadata=None, sow_content_summary=None):
+    def generate_report(self, analysis, sow_filename, document_metadata=None, sow_content_summary=None, output_buffer=None):
         """
         Main method called by app.py - generates PDF report
 
@@ -212,42 +554,66 @@ class ReportGenerator:
             sow_filename: Name of the SOW file
             document_metadata: Optional document metadata
             sow_content_summary: Optional SOW content summary from LLM
+            output_buffer: Optional writable file-like; when given, the PDF
+                is built into it (nothing touches disk) and the suggested
+                filename is returned instead of a path
 
         Returns:
-            str: Path to generated PDF file
+            str: Path to generated PDF file (or suggested filename when
+                 output_buffer is used)
         """
         try:
-            # Generate output filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_dir = 'reports'
-            os.makedirs(output_dir, exist_ok=True)
+            # One clock read per report - the filename timestamp and the
+            # cover page date come from the same instant
+            now = datetime.now()
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
 
             # Clean filename
-            safe_filename = "".join(c for c in sow_filename if c.isalnum() or c in (' ', '-', '_')).strip()
-            if not safe_filename:
-                safe_filename = "SOW_Document"
-
-            output_path = os.path.join(output_dir, f"SOW_Audit_{safe_filename}_{timestamp}.pdf")
+            safe_filename = _SAFE_FILENAME_RE.sub('', sow_filename).strip() or "SOW_Document"
+
+            output_filename = f"SOW_Audit_{safe_filename}_{timestamp}.pdf"
+
+            if output_buffer is not None:
+                # ✨ Stream the PDF into the caller's buffer - ReportLab
+                # writes progressively, so peak RAM stays O(page)
+                output_target = output_buffer
+                output_path = output_filename
+            else:
+                output_dir = 'reports'
+                os.makedirs(output_dir, exist_ok=True)
+                output_path = os.path.join(output_dir, output_filename)
+                # Build in memory and write once - handing the template a
+                # path makes ReportLab interleave seeks and writes on the
+                # open file while resolving cross-references, which is
+                # slow on network-backed filesystems
+                output_target = io.BytesIO()
 
             # Create PDF document
             doc = SimpleDocTemplate(
-                output_path,
+                output_target,
                 pagesize=letter,
                 rightMargin=self.margin,
                 leftMargin=self.margin,
                 topMargin=self.margin,
-                bottomMargin=self.margin
+                bottomMargin=self.margin,
+                # zlib-compress content streams on page flush - these
+                # text-heavy reports shrink several-fold for pure
+                # write-time cost, independent of the local rl_config
+                pageCompression=1
             )
 
             # Build story (content elements)
             story = []
 
+            # One pass over the pillars feeds every counting section
+            tally = self._tally(analysis.get('pillars', []))
+
             # Add cover page
-            story.extend(self._create_cover_page(sow_filename, analysis))
+            story.extend(self._create_cover_page(sow_filename, analysis, tally, now))
             story.append(PageBreak())
 
             # Add executive summary
-            story.extend(self._create_executive_summary(analysis, document_metadata))
+            story.extend(self._create_executive_summary(analysis, document_metadata, tally))
             story.append(PageBreak())
 
             # ✨ FIXED: Add pillar summary table with proper key findings
@@ -264,7 +630,7 @@ class ReportGenerator:
                 story.append(PageBreak())
 
             # Add risk matrix
-            story.extend(self._create_risk_analysis(analysis))
+            story.extend(self._create_risk_analysis(analysis, tally))
             story.append(PageBreak())
 
             # Add recommendations
@@ -275,14 +641,45 @@ class ReportGenerator:
                 story.append(PageBreak())
                 story.extend(self._create_sow_content_summary_section(sow_content_summary))
 
-            # Build PDF
-            doc.build(story, onFirstPage=self._add_page_header, onLaterPages=self._add_page_header)
+            # Build PDF. The story is deliberately laid out as ONE
+            # document: sharding sections into per-process builds and
+            # merging afterwards would need a PDF-merge dependency and
+            # would restart the "Page N" counter per shard. Parallelism
+            # lives a level up instead - generate_batch / the
+            # generate_report_bytes worker run whole reports per process.
+            header_fn = self._make_header_fn()
+            doc.build(story, onFirstPage=header_fn, onLaterPages=header_fn)
+
+            if output_buffer is None:
+                # One sequential write of the finished document
+                with open(output_path, 'wb') as f:
+                    f.write(output_target.getvalue())
 
             return output_path
 
         except Exception as e:
             raise Exception(f"Failed to generate PDF: {str(e)}")
 
+    @classmethod
+    def generate_batch(cls, jobs, max_workers=None):
+        """
+        Generate many reports in parallel across processes.
+
+        ReportLab layout is pure Python CPU work and each report is
+        independent, so a thread pool would just contend on the GIL; a
+        process pool gives near-linear speedup for bulk audits.
+
+        Args:
+            jobs: List of dicts with 'analysis', 'sow_filename' and
+                  optional 'document_metadata' / 'sow_content_summary'
+            max_workers: Worker processes (default: CPU count)
+
+        Returns:
+            List of report paths, aligned with jobs
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_generate_report_job, jobs))
+
     def _create_pillar_summary_table(self, analysis):
         """
         ✨✨✨ FIXED: Create pillar summary table with POPULATED key findings and text wrapping ✨✨✨
@@ -292,91 +689,51 @@ class ReportGenerator:
         elements.append(Paragraph("COMPLIANCE PILLAR SUMMARY", self.styles['SectionTitle']))
         elements.append(Spacer(1, 0.1*inch))
 
-        # Build table header
-        table_data = [[
-            Paragraph("<b>#</b>", self.styles['TableHeaderText']),
-            Paragraph("<b>Pillar</b>", self.styles['TableHeaderText']),
-            Paragraph("<b>Status</b>", self.styles['TableHeaderText']),
-            Paragraph("<b>Risk</b>", self.styles['TableHeaderText']),
-            Paragraph("<b>Key Finding</b>", self.styles['TableHeaderText'])
-        ]]
+        # Table header - shared prebuilt cells
+        table_data = [list(_pillar_header_row())]
 
-        # Add pillar rows with properly extracted key findings
-        for idx, pillar in enumerate(analysis.get('pillars', []), 1):
-            # Row number
-            row_num = Paragraph(str(idx), self.styles['TableCellText'])
+        # Key Finding budget from font metrics: roughly three wrapped
+        # lines in the 2.6" column (minus 8pt cell padding each side),
+        # rather than a magic character count that under- or overshoots
+        # what actually fits
+        max_chars = int(3 * (2.6 * inch - 16) / self._avg_char_w)
 
-            # Pillar name
-            pillar_name = Paragraph(
-                pillar.get('name', 'Unknown'),
-                self.styles['TableCellText']
-            )
+        # One style lookup for the whole table instead of two per row
+        cell_style = self.styles['TableCellText']
 
-            # Status
-            status = Paragraph(
-                pillar.get('status', 'Unknown'),
-                self.styles['TableCellText']
-            )
+        # Add pillar rows with properly extracted key findings. The three
+        # narrow columns (#, Status, Risk) are raw strings - their values
+        # never wrap, and a Paragraph cell forces the table layouter to
+        # run the full line-break algorithm per cell. Only Pillar and Key
+        # Finding keep Paragraph wrapping.
+        for idx, pillar in enumerate(analysis.get('pillars', []), 1):
+            pillar_name = Paragraph(pillar.get('name', 'Unknown'), cell_style)
 
-            # Risk level
-            risk = Paragraph(
-                pillar.get('risk_level', pillar.get('risklevel', 'Low')),
-                self.styles['TableCellText']
-            )
+            status = pillar.get('status', 'Unknown')
+            risk = pillar.get('risk_level', pillar.get('risklevel', 'Low'))
 
             # ✨ KEY FINDING - Extract using smart method
             finding_text = self._extract_key_finding(pillar)
 
             # Truncate if too long but keep meaningful length
-            if len(finding_text) > 200:
-                finding_text = finding_text[:197] + '...'
+            if len(finding_text) > max_chars:
+                finding_text = finding_text[:max_chars - 3] + '...'
 
-            finding_para = Paragraph(finding_text, self.styles['TableCellText'])
+            finding_para = Paragraph(_escape_if_needed(finding_text), cell_style)
 
-            table_data.append([row_num, pillar_name, status, risk, finding_para])
+            table_data.append([str(idx), pillar_name, status, risk, finding_para])
 
         # Create table with proper column widths for wrapping
         table_widths = [0.4*inch, 1.4*inch, 0.9*inch, 0.9*inch, 2.6*inch]
         table = Table(table_data, colWidths=table_widths, repeatRows=1)
 
-        # Apply comprehensive styling
+        # Shared static commands plus the per-row alternating colors -
+        # ROWBACKGROUNDS is re-walked over every row at paint time,
+        # explicit BACKGROUND commands are resolved once
+        table.setStyle(_PILLAR_BASE_STYLE)
         table.setStyle(TableStyle([
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1f4788')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#FFFFFF')),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('TOPPADDING', (0, 0), (-1, 0), 10),
-
-            # Body row styling
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#ffffff')),
-            ('TEXTCOLOR', (0, 1), (-1, -1), HexColor('#000000')),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-
-            # Alignment
-            ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # # column
-            ('ALIGN', (1, 1), (1, -1), 'LEFT'),    # Pillar column
-            ('ALIGN', (2, 1), (3, -1), 'CENTER'),  # Status & Risk columns
-            ('ALIGN', (4, 1), (4, -1), 'LEFT'),    # Key Finding column
-            ('VALIGN', (0, 1), (-1, -1), 'TOP'),   # ✨ TOP alignment for wrapping
-
-            # Padding for readability
-            ('TOPPADDING', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
-            ('LEFTPADDING', (0, 1), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 1), (-1, -1), 8),
-
-            # Grid and borders
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc')),
-            ('LINEABOVE', (0, 0), (-1, 0), 2, HexColor('#1f4788')),
-            ('LINEBELOW', (0, -1), (-1, -1), 2, HexColor('#1f4788')),
-
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [HexColor('#f9f9f9'), HexColor('#ffffff')])
+            ('BACKGROUND', (0, i), (-1, i), _ROW_COLORS[(i - 1) % 2])
+            for i in range(1, len(table_data))
         ]))
 
         elements.append(table)
@@ -390,201 +747,190 @@ class ReportGenerator:
         """
         elements = []
 
+        # Styles pulled once for the whole section - this method touches
+        # them dozens of times across the bullet lists
+        subsection_style = self.styles['SubsectionTitle']
+        body_style = self.styles['SOWBodyText']
+        bullet_style = self.styles['BulletPoint']
+        highlight_style = self.styles['HighlightText']
+
         # Section title
         elements.append(Paragraph("SOW CONTENT SUMMARY", self.styles['SectionTitle']))
         elements.append(Spacer(1, 0.1*inch))
 
         # Overview
         if summary.get('overview'):
-            elements.append(Paragraph("<b>Document Overview</b>", self.styles['SubsectionTitle']))
+            elements.append(Paragraph("<b>Document Overview</b>", subsection_style))
             overview_text = summary['overview']
             paragraphs = overview_text.split('\n\n')
             for para in paragraphs:
                 if para.strip():
-                    elements.append(Paragraph(para.strip(), self.styles['SOWBodyText']))
-            elements.append(Spacer(1, 0.15*inch))
+                    elements.append(Paragraph(para.strip(), body_style))
+            elements.append(Spacer(1, _SPACER_H))
 
         # ✨ Parties Involved with proper text wrapping
         if summary.get('parties_involved'):
-            elements.append(Paragraph("<b>Parties Involved</b>", self.styles['SubsectionTitle']))
+            elements.append(Paragraph("<b>Parties Involved</b>", subsection_style))
             parties = summary['parties_involved']
 
             # Create table data with Paragraph objects for wrapping
+            label_style = self.styles['TableCellLabel']
+            cell_style = self.styles['TableCellText']
             parties_data = [
-                [
-                    Paragraph("<b>Vendor:</b>", self.styles['TableCellLabel']),
-                    Paragraph(parties.get('vendor_name', 'Not specified'), self.styles['TableCellText'])
-                ],
-                [
-                    Paragraph("<b>Client:</b>", self.styles['TableCellLabel']),
-                    Paragraph(parties.get('client_name', 'Not specified'), self.styles['TableCellText'])
-                ],
-                [
-                    Paragraph("<b>Vendor Role:</b>", self.styles['TableCellLabel']),
-                    Paragraph(parties.get('vendor_role', 'Not specified'), self.styles['TableCellText'])
-                ],
-                [
-                    Paragraph("<b>Client Role:</b>", self.styles['TableCellLabel']),
-                    Paragraph(parties.get('client_role', 'Not specified'), self.styles['TableCellText'])
-                ]
+                [Paragraph(f"<b>{label}</b>", label_style),
+                 Paragraph(parties.get(key, 'Not specified'), cell_style)]
+                for label, key in (('Vendor:', 'vendor_name'),
+                                   ('Client:', 'client_name'),
+                                   ('Vendor Role:', 'vendor_role'),
+                                   ('Client Role:', 'client_role'))
             ]
 
             # Create table with proper column widths
             parties_table = Table(parties_data, colWidths=[1.4*inch, 4.8*inch])
-            parties_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), HexColor('#f0f0f0')),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('TOPPADDING', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-                ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 0.5, HexColor('#cccccc'))
-            ]))
+            parties_table.setStyle(_PARTIES_TABLE_STYLE)
             elements.append(parties_table)
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Spacer(1, _SPACER_H))
 
         # Scope Highlights
         if summary.get('scope_highlights'):
-            elements.append(Paragraph("<b>Scope Highlights</b>", self.styles['SubsectionTitle']))
-            for highlight in summary['scope_highlights']:
-                elements.append(Paragraph(f"• {highlight}", self.styles['BulletPoint']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Scope Highlights</b>", subsection_style))
+            # Bullet lists feed extend with a generator - one bound-method
+            # call per list instead of one append per bullet
+            elements.extend(Paragraph(f"• {highlight}", bullet_style)
+                            for highlight in summary['scope_highlights'])
+            elements.append(Spacer(1, _SPACER_H))
 
         # Key Deliverables
         if summary.get('deliverables'):
-            elements.append(Paragraph("<b>Key Deliverables</b>", self.styles['SubsectionTitle']))
-            for deliverable in summary['deliverables']:
-                elements.append(Paragraph(f"• {deliverable}", self.styles['BulletPoint']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Key Deliverables</b>", subsection_style))
+            elements.extend(Paragraph(f"• {deliverable}", bullet_style)
+                            for deliverable in summary['deliverables'])
+            elements.append(Spacer(1, _SPACER_H))
 
         # Timeline Overview
         if summary.get('timeline_overview'):
-            elements.append(Paragraph("<b>Project Timeline</b>", self.styles['SubsectionTitle']))
-            elements.append(Paragraph(summary['timeline_overview'], self.styles['SOWBodyText']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Project Timeline</b>", subsection_style))
+            elements.append(Paragraph(summary['timeline_overview'], body_style))
+            elements.append(Spacer(1, _SPACER_H))
 
         # Cost Structure
         if summary.get('cost_structure'):
-            elements.append(Paragraph("<b>Cost Structure</b>", self.styles['SubsectionTitle']))
-            elements.append(Paragraph(summary['cost_structure'], self.styles['HighlightText']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Cost Structure</b>", subsection_style))
+            elements.append(Paragraph(summary['cost_structure'], highlight_style))
+            elements.append(Spacer(1, _SPACER_H))
 
         # Technology Stack
         if summary.get('technology_stack'):
-            elements.append(Paragraph("<b>Technology Stack</b>", self.styles['SubsectionTitle']))
+            elements.append(Paragraph("<b>Technology Stack</b>", subsection_style))
             tech_items = ", ".join(summary['technology_stack'])
-            elements.append(Paragraph(tech_items, self.styles['SOWBodyText']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph(tech_items, body_style))
+            elements.append(Spacer(1, _SPACER_H))
 
         # Key Sections
         if summary.get('key_sections'):
-            elements.append(Paragraph("<b>Document Structure</b>", self.styles['SubsectionTitle']))
-            for section in summary['key_sections']:
-                elements.append(Paragraph(f"• {section}", self.styles['BulletPoint']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Document Structure</b>", subsection_style))
+            elements.extend(Paragraph(f"• {section}", bullet_style)
+                            for section in summary['key_sections'])
+            elements.append(Spacer(1, _SPACER_H))
 
         # Special Terms
         if summary.get('special_terms'):
-            elements.append(Paragraph("<b>Special Terms & Conditions</b>", self.styles['SubsectionTitle']))
-            for term in summary['special_terms']:
-                elements.append(Paragraph(f"⚠ {term}", self.styles['HighlightText']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Special Terms & Conditions</b>", subsection_style))
+            elements.extend(Paragraph(f"⚠ {term}", highlight_style)
+                            for term in summary['special_terms'])
+            elements.append(Spacer(1, _SPACER_H))
 
         # Assumptions & Constraints
         if summary.get('assumptions_constraints'):
-            elements.append(Paragraph("<b>Key Assumptions & Constraints</b>", self.styles['SubsectionTitle']))
-            for item in summary['assumptions_constraints']:
-                elements.append(Paragraph(f"• {item}", self.styles['BulletPoint']))
-            elements.append(Spacer(1, 0.15*inch))
+            elements.append(Paragraph("<b>Key Assumptions & Constraints</b>", subsection_style))
+            elements.extend(Paragraph(f"• {item}", bullet_style)
+                            for item in summary['assumptions_constraints'])
+            elements.append(Spacer(1, _SPACER_H))
 
         return elements
 
-    def _create_cover_page(self, sow_filename, analysis):
+    def _create_cover_page(self, sow_filename, analysis, tally, now):
         """Create professional cover page"""
         elements = []
 
-        elements.append(Spacer(1, 0.5*inch))
-        elements.append(Paragraph("SOW AUDIT REPORT", self.styles['CustomTitle']))
-        elements.append(Spacer(1, 0.2*inch))
-        elements.append(Paragraph(sow_filename, self.styles['Heading2']))
-        elements.append(Spacer(1, 0.4*inch))
-
+        status_counts, risk_counts, score = tally
         total = len(analysis.get('pillars', []))
-        met = sum(1 for p in analysis['pillars'] if p.get('status') == 'Met')
-        score = round((met / total) * 100, 1) if total > 0 else 0
 
-        score_text = f"{score}% Overall Compliance Score"
-        elements.append(Paragraph(score_text, self.styles['Heading2']))
-        elements.append(Spacer(1, 0.3*inch))
+        # Title/filename/score/date as ONE single-column table instead of
+        # four Paragraphs interleaved with Spacers - eight flowables each
+        # paying a wrap()/draw() cycle collapse into one, with row padding
+        # reproducing the old spacing
+        date_text = f"Report Generated: {now.strftime('%B %d, %Y at %I:%M %p IST')}"
+        header_table = Table([
+            [Paragraph("SOW AUDIT REPORT", self.styles['CustomTitle'])],
+            [Paragraph(sow_filename, self.styles['Heading2'])],
+            [Paragraph(f"{score}% Overall Compliance Score", self.styles['Heading2'])],
+            [Paragraph(date_text, self.styles['Normal'])]
+        ], colWidths=[6*inch])
+        header_table.setStyle(_COVER_HEADER_STYLE)
 
-        date_text = f"Report Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p IST')}"
-        elements.append(Paragraph(date_text, self.styles['Normal']))
+        elements.append(Spacer(1, 0.5*inch))
+        elements.append(KeepTogether(header_table))
         elements.append(Spacer(1, 1*inch))
 
         summary_data = [
             ['Total Pillars', f"{total}"],
-            ['Met Requirements', f"{met}"],
-            ['Partial Compliance', f"{sum(1 for p in analysis['pillars'] if p.get('status') == 'Partial')}"],
-            ['Not Met', f"{sum(1 for p in analysis['pillars'] if p.get('status') == 'Not Met')}"],
-            ['Critical Issues', f"{sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'Critical')}"],
-            ['High Risk Issues', f"{sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'High')}"]
+            ['Met Requirements', f"{status_counts['Met']}"],
+            ['Partial Compliance', f"{status_counts['Partial']}"],
+            ['Not Met', f"{status_counts['Not Met']}"],
+            ['Critical Issues', f"{risk_counts['Critical']}"],
+            ['High Risk Issues', f"{risk_counts['High']}"]
         ]
 
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), HexColor('#f0f0f0')),
-            ('BACKGROUND', (1, 0), (1, -1), HexColor('#e8f4f8')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, black)
-        ]))
+        summary_table.setStyle(_COVER_SUMMARY_STYLE)
 
         elements.append(summary_table)
 
         return elements
 
-    def _create_executive_summary(self, analysis, document_metadata):
+    def _create_executive_summary(self, analysis, document_metadata, tally):
         """Create executive summary section"""
         elements = []
 
         elements.append(Paragraph("EXECUTIVE SUMMARY", self.styles['SectionTitle']))
         elements.append(Spacer(1, 0.1*inch))
 
+        status_counts, risk_counts, score = tally
         total = len(analysis.get('pillars', []))
-        met = sum(1 for p in analysis['pillars'] if p.get('status') == 'Met')
-        partial = sum(1 for p in analysis['pillars'] if p.get('status') == 'Partial')
-        not_met = sum(1 for p in analysis['pillars'] if p.get('status') == 'Not Met')
-        critical = sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'Critical')
-        high = sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'High')
-        score = round((met / total) * 100, 1) if total > 0 else 0
-
-        overview = f"""
-This comprehensive SOW (Statement of Work) audit report evaluates compliance against nine mandatory
-divestment pillars. The analysis resulted in an overall compliance score of {score}%, with {met}
-pillars fully compliant and {not_met} areas requiring remediation.
-
-Key Findings:
-• {met} of {total} pillars meet all requirements
-• {partial} pillars show partial compliance
-• {not_met} pillars require immediate remediation
-• {critical} critical issues identified
-• {high} high-risk items requiring action
-"""
+        met = status_counts['Met']
+        partial = status_counts['Partial']
+        not_met = status_counts['Not Met']
+        critical = risk_counts['Critical']
+        high = risk_counts['High']
+
+        # One Paragraph per line instead of one large multi-line string -
+        # no big intermediate allocation, and the layouter wraps and
+        # measures each short line independently
+        lines = [
+            f"This comprehensive SOW (Statement of Work) audit report evaluates "
+            f"compliance against nine mandatory divestment pillars. The analysis "
+            f"resulted in an overall compliance score of {score}%, with {met} "
+            f"pillars fully compliant and {not_met} areas requiring remediation.",
+            "Key Findings:",
+            f"• {met} of {total} pillars meet all requirements",
+            f"• {partial} pillars show partial compliance",
+            f"• {not_met} pillars require immediate remediation",
+            f"• {critical} critical issues identified",
+            f"• {high} high-risk items requiring action"
+        ]
 
         if document_metadata:
-            overview += f"""
-Document Analysis:
-• File: {document_metadata.get('filename', 'Unknown')}
-• Format: {document_metadata.get('format', 'Unknown')}
-• Size: {document_metadata.get('size_mb', 0)} MB
-• Pages: {document_metadata.get('page_count', 'Unknown')}
-"""
+            lines.extend([
+                "Document Analysis:",
+                f"• File: {document_metadata.get('filename', 'Unknown')}",
+                f"• Format: {document_metadata.get('format', 'Unknown')}",
+                f"• Size: {document_metadata.get('size_mb', 0)} MB",
+                f"• Pages: {document_metadata.get('page_count', 'Unknown')}"
+            ])
 
-        elements.append(Paragraph(overview, self.styles['SOWBodyText']))
+        body_style = self.styles['SOWBodyText']
+        elements.extend(Paragraph(line, body_style) for line in lines)
         elements.append(Spacer(1, 0.2*inch))
 
         return elements
@@ -596,37 +942,50 @@ Document Analysis:
         elements.append(Paragraph("DETAILED PILLAR ANALYSIS", self.styles['SectionTitle']))
         elements.append(Spacer(1, 0.1*inch))
 
+        # Styles pulled once - this loop touches them up to eight times
+        # per pillar
+        subsection_style = self.styles['SubsectionTitle']
+        body_style = self.styles['SOWBodyText']
+        evidence_style = self.styles['EvidenceText']
+        recommendation_style = self.styles['RecommendationText']
+
         for idx, pillar in enumerate(analysis.get('pillars', []), 1):
             elements.append(Paragraph(
                 f"{idx}. {pillar.get('name', 'Unknown Pillar')}",
-                self.styles['SubsectionTitle']
+                subsection_style
             ))
 
             status = pillar.get('status', 'Unknown')
             risk = pillar.get('risk_level', pillar.get('risklevel', 'Low'))
             elements.append(Paragraph(
                 f"Status: {status} | Risk Level: {risk}",
-                self.styles['SOWBodyText']
+                body_style
             ))
 
-            # ✨ Use smart extraction for key finding
+            # ✨ Label and body fused into one Paragraph with inline bold
+            # markup - halves the flowables the layouter walks per pillar.
+            # The LLM-sourced body is XML-escaped so stray angle brackets
+            # in contract quotes can't break the markup parse.
             key_finding = self._extract_key_finding(pillar)
             if key_finding:
-                elements.append(Paragraph("Key Finding:", self.styles['SOWBodyText']))
-                elements.append(Paragraph(key_finding, self.styles['EvidenceText']))
+                elements.append(Paragraph(
+                    f"<b>Key Finding:</b> {_escape_if_needed(key_finding)}", evidence_style))
 
-            if pillar.get('evidence'):
-                elements.append(Paragraph("Evidence:", self.styles['SOWBodyText']))
-                elements.append(Paragraph(pillar.get('evidence', ''), self.styles['EvidenceText']))
+            evidence = pillar.get('evidence')
+            if evidence:
+                elements.append(Paragraph(
+                    f"<b>Evidence:</b> {_escape_if_needed(evidence)}", evidence_style))
 
             recommendations = pillar.get('recommendation', pillar.get('recommendations', []))
             if recommendations:
-                elements.append(Paragraph("Recommendation:", self.styles['SOWBodyText']))
                 if isinstance(recommendations, list):
-                    for rec in recommendations:
-                        elements.append(Paragraph(f"• {rec}", self.styles['RecommendationText']))
+                    elements.append(Paragraph("<b>Recommendation:</b>", body_style))
+                    elements.extend(Paragraph(f"• {rec}", recommendation_style)
+                                    for rec in recommendations)
                 else:
-                    elements.append(Paragraph(recommendations, self.styles['RecommendationText']))
+                    elements.append(Paragraph(
+                        f"<b>Recommendation:</b> {_escape_if_needed(recommendations)}",
+                        recommendation_style))
 
             elements.append(Spacer(1, 0.2*inch))
 
@@ -651,7 +1010,7 @@ Document Analysis:
 
         return elements
 
-    def _create_risk_analysis(self, analysis):
+    def _create_risk_analysis(self, analysis, tally):
         """Create risk analysis section"""
         elements = []
 
@@ -664,31 +1023,20 @@ Document Analysis:
             Paragraph("<b>Percentage</b>", self.styles['TableHeaderText'])
         ]]
 
+        _, risk_counts, _ = tally
         total = len(analysis.get('pillars', []))
         if total > 0:
-            critical_count = sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'Critical')
-            high_count = sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'High')
-            medium_count = sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'Medium')
-            low_count = sum(1 for p in analysis['pillars'] if p.get('risk_level', p.get('risklevel')) == 'Low')
-
-            risk_data.extend([
-                ["Critical", f"{critical_count}", f"{round(critical_count/total*100,1)}%"],
-                ["High", f"{high_count}", f"{round(high_count/total*100,1)}%"],
-                ["Medium", f"{medium_count}", f"{round(medium_count/total*100,1)}%"],
-                ["Low", f"{low_count}", f"{round(low_count/total*100,1)}%"]
-            ])
+            risk_data.extend(
+                [level, f"{risk_counts[level]}", f"{round(risk_counts[level]/total*100,1)}%"]
+                for level in ('Critical', 'High', 'Medium', 'Low')
+            )
 
         risk_table = Table(risk_data, colWidths=[2*inch, 1*inch, 1.5*inch])
+        # Same shared-base + explicit-BACKGROUND split as the pillar table
+        risk_table.setStyle(_RISK_BASE_STYLE)
         risk_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#1f4788')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#cccccc')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [HexColor('#f9f9f9'), HexColor('#ffffff')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8)
+            ('BACKGROUND', (0, i), (-1, i), _ROW_COLORS[(i - 1) % 2])
+            for i in range(1, len(risk_data))
         ]))
 
         elements.append(risk_table)
@@ -711,42 +1059,153 @@ Document Analysis:
                 self.styles['SOWBodyText']
             ))
         else:
+            # Style lookups and the constant spacer height hoisted out of
+            # the per-pillar loop
+            subsection_style = self.styles['SubsectionTitle']
+            rec_style = self.styles['RecommendationText']
+
             for idx, pillar in enumerate(non_compliant_pillars, 1):
                 risk = pillar.get('risk_level', pillar.get('risklevel', 'Unknown'))
-                elements.append(Paragraph(
-                    f"{idx}. {pillar.get('name', 'Unknown')} [{risk} Risk]",
-                    self.styles['SubsectionTitle']
-                ))
-
                 recommendations = pillar.get('recommendation', pillar.get('recommendations', []))
                 if isinstance(recommendations, list):
-                    for rec in recommendations:
-                        elements.append(Paragraph(f"• {rec}", self.styles['RecommendationText']))
+                    body = [Paragraph(f"• {rec}", rec_style) for rec in recommendations]
                 else:
-                    elements.append(Paragraph(
-                        recommendations or 'No recommendation provided.',
-                        self.styles['RecommendationText']
-                    ))
-
-                elements.append(Spacer(1, 0.15*inch))
+                    body = [Paragraph(recommendations or _NO_REC, rec_style)]
+
+                # One extend per pillar (Spacer instances stay distinct -
+                # ReportLab mutates flowables during layout)
+                elements.extend((
+                    Paragraph(f"{idx}. {pillar.get('name', 'Unknown')} [{risk} Risk]",
+                              subsection_style),
+                    *body,
+                    Spacer(1, _SPACER_H),
+                ))
 
         return elements
 
-    def _add_page_header(self, canvas, doc):
-        """Add header to each page"""
-        canvas.saveState()
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.drawString(self.margin, self.page_height - 0.3*inch, "SOW AUDIT REPORT - CONFIDENTIAL")
-        canvas.setFont("Helvetica", 8)
-        canvas.drawRightString(
-            self.page_width - self.margin,
-            self.page_height - 0.3*inch,
-            f"Page {doc.page}"
-        )
-        canvas.restoreState()
+    def _make_header_fn(self):
+        """Page-header callback, specialized per build - the constant
+        coordinates live in the closure's cells instead of being
+        re-fetched off self once per page, and the canvas method used
+        twice is bound to a local"""
+        margin, y, right_x = self.margin, self._hdr_y, self._hdr_right_x
+
+        def header(canvas, doc):
+            set_font = canvas.setFont
+            canvas.saveState()
+            set_font("Helvetica-Bold", 10)
+            canvas.drawString(margin, y, _HEADER_TEXT)
+            set_font("Helvetica", 8)
+            canvas.drawRightString(right_x, y, "Page " + str(doc.page))
+            canvas.restoreState()
+
+        return header
+
+    def _metadata_blob(self, metadata):
+        """Compact JSON bytes for the metadata dict, encoded once per
+        object - regenerating the JSON report for the same audit reuses
+        the bytes instead of re-walking the dict. Identity-keyed like
+        llm_analyzer's table memo (the memo's reference keeps the id
+        live); returns None when orjson is unavailable.
+        """
+        memo = self._meta_memo
+        if memo is not None and memo[0] is metadata:
+            return memo[1]
+        if not _ORJSON_AVAILABLE or not isinstance(metadata, dict):
+            return None
+        blob = orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        self._meta_memo = (metadata, blob)
+        return blob
+
+    def generate_json_report(self, analysis, metadata, project_info, pretty=False,
+                             background=False, compress=False):
+        """Generate JSON report for data integration
+
+        Emits compact JSON by default (downstream tools parse it, nobody
+        reads it); pass pretty=True for an indented file when debugging.
+
+        With background=True the disk write runs on a helper thread (the
+        GIL releases during write(), so it overlaps a concurrent PDF
+        build) and the path is returned immediately - call wait_json()
+        once the PDF is done to surface any write error.
+
+        compress=True writes a .json.gz instead (gzip level 1) - same
+        schema, ~5-10x smaller for network transfer of large reports.
+        """
+        if isinstance(analysis, dict) and '_view' in analysis:
+            # pillar_checker caches a derived PillarView object on the
+            # analysis dict - not serializable and not report data. The
+            # shallow copy only happens when the key is present; the
+            # caller's dict is never mutated (popping and restoring
+            # around the dump would corrupt it if the dump raises)
+            analysis = {k: v for k, v in analysis.items() if k != '_view'}
+
+        now = datetime.now()
+        report = {
+            # orjson formats datetime in C (RFC 3339, same shape as
+            # isoformat); the stdlib encoder needs the string up front
+            "audit_date": now if _ORJSON_AVAILABLE else now.isoformat(timespec='seconds'),
+            "document_metadata": metadata,
+            "project_info": project_info,
+            "analysis": analysis
+        }
+
+        # with_suffix swaps only the trailing extension - str.replace
+        # scanned the whole path and corrupted any '.pdf' in the stem
+        json_path = str(PurePath(self.output_path).with_suffix('.json'))
+        if compress:
+            json_path += '.gz'
+
+        # Compact runs splice the memoized metadata bytes straight into
+        # the output - see _metadata_blob
+        blob = None if pretty else self._metadata_blob(metadata)
+        encoded = {'document_metadata': blob} if blob is not None else None
+
+        if background:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=1)
+            self._json_future = self._io_pool.submit(
+                _dump_json, report, json_path, pretty, encoded, compress)
+            return json_path
+
+        # Only wrap I/O failures - serialization errors propagate with
+        # their own type and full traceback (re-raising as a bare
+        # Exception hid both and stringified potentially huge payloads)
+        try:
+            _dump_json(report, json_path, pretty=pretty, encoded=encoded,
+                       compress=compress)
+            return json_path
+        except OSError as e:
+            raise RuntimeError(f"JSON write failed: {json_path}") from e
+
+    def wait_json(self):
+        """Wait for a background generate_json_report write to finish
+
+        No-op when nothing is pending; re-raises a failed write in the
+        caller's thread with the same error shape as the synchronous path.
+        """
+        future, self._json_future = self._json_future, None
+        if future is not None:
+            try:
+                future.result()
+            except OSError as e:
+                raise RuntimeError("JSON write failed") from e
+
+    def generate_msgpack_report(self, analysis, metadata, project_info):
+        """Binary MessagePack variant of the JSON report - identical
+        schema, several-fold smaller and faster to encode for
+        integration consumers that support it. JSON stays the default
+        for human and legacy consumers; requires the optional ormsgpack
+        package.
+        """
+        if not _ORMSGPACK_AVAILABLE:
+            raise RuntimeError(
+                "ormsgpack is not installed - MessagePack report output unavailable")
+
+        if isinstance(analysis, dict) and '_view' in analysis:
+            # Same cached-PillarView exclusion as generate_json_report
+            analysis = {k: v for k, v in analysis.items() if k != '_view'}
 
-    def generate_json_report(self, analysis, metadata, project_info):
-        """Generate JSON report for data integration"""
         report = {
             "audit_date": datetime.now().isoformat(),
             "document_metadata": metadata,
@@ -754,10 +1213,10 @@ Document Analysis:
             "analysis": analysis
         }
 
-        json_path = self.output_path.replace('.pdf', '.json')
+        msgpack_path = str(PurePath(self.output_path).with_suffix('.msgpack'))
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
-            return json_path
-        except Exception as e:
-            raise Exception(f"JSON generation failed: {str(e)}")
+            with open(msgpack_path, 'wb') as f:
+                f.write(ormsgpack.packb(report, option=ormsgpack.OPT_SERIALIZE_NUMPY))
+            return msgpack_path
+        except OSError as e:
+            raise RuntimeError(f"MessagePack write failed: {msgpack_path}") from e